@@ -7,12 +7,17 @@ of departure against trips that complete normally.
 
 from __future__ import annotations
 
-import json
 import sys
 from collections import Counter, defaultdict
 from dataclasses import dataclass
 from datetime import datetime
-from typing import Any, Iterable
+from pathlib import Path
+from typing import Any
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from src.data.log_files import iter_jsonl
+
 
 STOP_BOARDING = "5522"
 DIRECTION_INBOUND = 0
@@ -99,18 +104,6 @@ def _parse_ts(value: str) -> datetime:
     return datetime.fromisoformat(value)
 
 
-def _iter_lines(path: str) -> Iterable[dict[str, Any]]:
-    with open(path, "r", encoding="utf-8") as handle:
-        for line in handle:
-            line = line.strip()
-            if not line:
-                continue
-            try:
-                yield json.loads(line)
-            except json.JSONDecodeError:
-                continue
-
-
 def _prediction_stop_id(pred: dict[str, Any]) -> str | None:
     return (
         pred.get("relationships", {})
@@ -167,7 +160,7 @@ def main() -> int:
     completed_stats = GroupStats()
     ignored_stats = GroupStats()
 
-    for entry in _iter_lines(path):
+    for entry in iter_jsonl(path):
         ts_raw = entry.get("timestamp")
         if not ts_raw:
             continue
@@ -6,12 +6,16 @@ The script streams the file and prints summary stats.
 
 from __future__ import annotations
 
-import json
 import sys
 from collections import Counter
 from dataclasses import dataclass
 from datetime import datetime, timezone
-from typing import Any, Iterable
+from pathlib import Path
+from typing import Any
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from src.data.log_files import iter_jsonl
 
 
 STOP_BOARDING = "5522"
@@ -31,18 +35,6 @@ def _parse_ts(value: str) -> datetime:
     return datetime.fromisoformat(value)
 
 
-def _iter_lines(path: str) -> Iterable[dict[str, Any]]:
-    with open(path, "r", encoding="utf-8") as handle:
-        for line in handle:
-            line = line.strip()
-            if not line:
-                continue
-            try:
-                yield json.loads(line)
-            except json.JSONDecodeError:
-                continue
-
-
 def _prediction_stop_id(pred: dict[str, Any]) -> str | None:
     return (
         pred.get("relationships", {})
@@ -123,7 +115,7 @@ def main() -> int:
 
     first_assignment_seen: set[tuple[str, str]] = set()
 
-    for entry in _iter_lines(path):
+    for entry in iter_jsonl(path):
         ts_raw = entry.get("timestamp")
         if not ts_raw:
             continue
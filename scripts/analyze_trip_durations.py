@@ -2,12 +2,17 @@
 
 from __future__ import annotations
 
-import json
 import sys
 from dataclasses import dataclass
 from datetime import datetime
+from pathlib import Path
 from statistics import mean
-from typing import Any, Iterable, Iterator
+from typing import Any
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from src.data.log_files import iter_jsonl
+
 
 ROUTE_ID = "109"
 
@@ -36,18 +41,6 @@ def _parse_ts(value: str) -> datetime:
     return datetime.fromisoformat(value)
 
 
-def _iter_jsonl(path: str) -> Iterator[dict[str, Any]]:
-    with open(path, "r", encoding="utf-8") as handle:
-        for line in handle:
-            line = line.strip()
-            if not line:
-                continue
-            try:
-                yield json.loads(line)
-            except json.JSONDecodeError:
-                continue
-
-
 def _vehicle_route_id(vehicle: dict[str, Any]) -> str | None:
     return (
         vehicle.get("relationships", {})
@@ -149,7 +142,7 @@ def main() -> int:
 
     last_trip_by_vehicle: dict[str, TripRecord] = {}
 
-    for entry in _iter_jsonl(path):
+    for entry in iter_jsonl(path):
         ts_raw = entry.get("timestamp")
         if not ts_raw:
             continue
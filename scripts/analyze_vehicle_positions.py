@@ -2,12 +2,17 @@
 
 from __future__ import annotations
 
-import json
 import sys
 from collections import Counter
 from dataclasses import dataclass
 from datetime import datetime
-from typing import Any, Iterable, Iterator
+from pathlib import Path
+from typing import Any, Iterable
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from src.data.log_files import iter_jsonl
+
 
 PREDICTIONS_PATH = "data/samples/predictions.jsonl"
 VEHICLES_PATH = "data/samples/vehicles.jsonl"
@@ -79,18 +84,6 @@ def _parse_ts(value: str) -> datetime:
     return datetime.fromisoformat(value)
 
 
-def _iter_jsonl(path: str) -> Iterator[dict[str, Any]]:
-    with open(path, "r", encoding="utf-8") as handle:
-        for line in handle:
-            line = line.strip()
-            if not line:
-                continue
-            try:
-                yield json.loads(line)
-            except json.JSONDecodeError:
-                continue
-
-
 def _prediction_stop_id(pred: dict[str, Any]) -> str | None:
     return (
         pred.get("relationships", {})
@@ -189,8 +182,8 @@ def main() -> int:
     predictions_path = sys.argv[1] if len(sys.argv) > 1 else PREDICTIONS_PATH
     vehicles_path = sys.argv[2] if len(sys.argv) > 2 else VEHICLES_PATH
 
-    pred_iter = _iter_jsonl(predictions_path)
-    veh_iter = _iter_jsonl(vehicles_path)
+    pred_iter = iter_jsonl(predictions_path)
+    veh_iter = iter_jsonl(vehicles_path)
 
     pred_entry = next(pred_iter, None)
     veh_entry = next(veh_iter, None)
@@ -2,14 +2,19 @@
 
 from __future__ import annotations
 
-import json
 import sys
 from collections import Counter, defaultdict
 from dataclasses import dataclass
 from datetime import datetime
+from pathlib import Path
 from statistics import mean
 from typing import Any, Iterable, Iterator
 
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from src.data.log_files import iter_jsonl
+
+
 PREDICTIONS_PATH = "data/samples/predictions.jsonl"
 VEHICLES_PATH = "data/samples/vehicles.jsonl"
 
@@ -49,21 +54,9 @@ def _parse_ts(value: str) -> datetime:
     return datetime.fromisoformat(value)
 
 
-def _iter_jsonl(path: str) -> Iterator[dict[str, Any]]:
-    with open(path, "r", encoding="utf-8") as handle:
-        for line in handle:
-            line = line.strip()
-            if not line:
-                continue
-            try:
-                yield json.loads(line)
-            except json.JSONDecodeError:
-                continue
-
-
 def _iter_aligned(pred_path: str, veh_path: str) -> Iterator[tuple[dict[str, Any], dict[str, Any], datetime]]:
-    pred_iter = _iter_jsonl(pred_path)
-    veh_iter = _iter_jsonl(veh_path)
+    pred_iter = iter_jsonl(pred_path)
+    veh_iter = iter_jsonl(veh_path)
     pred_entry = next(pred_iter, None)
     veh_entry = next(veh_iter, None)
 
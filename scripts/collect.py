@@ -8,7 +8,6 @@ import time
 from datetime import datetime, timezone
 from typing import Any
 
-from dotenv import load_dotenv
 import requests
 
 from src.data.collector_client import (
@@ -20,6 +19,7 @@ from src.data.collector_client import (
     fetch_schedules,
     fetch_snapshot,
 )
+from src.config import load_env
 
 POLL_INTERVAL_SECONDS_DEFAULT = 30
 SCHEDULE_SNAPSHOT_INTERVAL_SECONDS = 3600
@@ -39,7 +39,7 @@ def _utc_now_iso() -> str:
 
 
 def _load_config() -> dict[str, Any]:
-    load_dotenv()
+    load_env()
     api_key = os.environ.get("MBTA_API_KEY", "").strip()
     if not api_key:
         raise SystemExit("MBTA_API_KEY missing in environment")
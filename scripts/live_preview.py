@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import argparse
 import json
+import logging
 from pathlib import Path
 import sys
 import threading
@@ -90,12 +91,10 @@ def _build_frame_data(
     seen_trip_ids: set[str] = set()
 
     schedule_map = _load_boarding_schedule_map()
-    vehicles_by_id = {v.get("id"): v for v in result.vehicles if isinstance(v, dict)}
+    vehicles_by_id = result.vehicles_by_id
     next_cache: dict[str, float] = {}
 
     for pred in result.predictions:
-        if not isinstance(pred, dict):
-            continue
         attrs = pred.get("attributes", {})
         rels = pred.get("relationships", {})
         trip_rel = rels.get("trip") or {}
@@ -341,6 +340,7 @@ def main() -> int:
     args = parser.parse_args()
 
     config = load_config()
+    logging.basicConfig(level=config.log.level)
     api_key = config.mbta.api_key
 
     output_emulator = args.output in {"emulator", "both"}
@@ -3,10 +3,16 @@
 from __future__ import annotations
 
 import os
+import sys
+from dataclasses import dataclass
+from pathlib import Path
 from typing import Any
 
 import requests
-from dotenv import load_dotenv
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from src.config import load_env
 
 MBTA_API_BASE = "https://api-v3.mbta.com"
 ROUTE_ID = "109"
@@ -18,7 +24,7 @@ TARGET_STOP_NAMES = [
 
 
 def _require_api_key() -> str:
-    load_dotenv()
+    load_env()
     api_key = os.environ.get("MBTA_API_KEY", "").strip()
     if not api_key:
         raise SystemExit("MBTA_API_KEY is missing. Set it in .env.")
@@ -56,58 +62,45 @@ def _fetch_route_patterns(api_key: str) -> list[dict[str, Any]]:
     return patterns
 
 
-def _fetch_stops_for_pattern(api_key: str, pattern_id: str) -> list[dict[str, Any]]:
+@dataclass(frozen=True, slots=True)
+class Stop:
+    sequence: int | None
+    id: str
+    name: str
+
+
+def _parse_stops(data: dict[str, Any]) -> list[Stop]:
+    stops = [
+        Stop(
+            sequence=stop.get("attributes", {}).get("sequence"),
+            id=stop.get("id"),
+            name=stop.get("attributes", {}).get("name", ""),
+        )
+        for stop in data.get("data", [])
+    ]
+    stops.sort(key=lambda s: (s.sequence is None, s.sequence or 0))
+    return stops
+
+
+def _fetch_stops_for_pattern(api_key: str, pattern_id: str) -> list[Stop]:
     params = {
         "filter[route_pattern]": pattern_id,
         "fields[stop]": "name",
     }
-    data = _get("/stops", params=params, api_key=api_key)
-    stops = []
-    for stop in data.get("data", []):
-        stops.append(
-            {
-                "sequence": stop.get("attributes", {}).get("sequence"),
-                "id": stop.get("id"),
-                "name": stop.get("attributes", {}).get("name", ""),
-            }
-        )
-    stops.sort(key=lambda s: (s.get("sequence") is None, s.get("sequence") or 0))
-    return stops
+    return _parse_stops(_get("/stops", params=params, api_key=api_key))
 
 
-def _fetch_stops_for_pattern_direct(api_key: str, pattern_id: str) -> list[dict[str, Any]]:
-    data = _get(f"/route_patterns/{pattern_id}/stops", params={}, api_key=api_key)
-    stops = []
-    for stop in data.get("data", []):
-        stops.append(
-            {
-                "sequence": stop.get("attributes", {}).get("sequence"),
-                "id": stop.get("id"),
-                "name": stop.get("attributes", {}).get("name", ""),
-            }
-        )
-    stops.sort(key=lambda s: (s.get("sequence") is None, s.get("sequence") or 0))
-    return stops
+def _fetch_stops_for_pattern_direct(api_key: str, pattern_id: str) -> list[Stop]:
+    return _parse_stops(_get(f"/route_patterns/{pattern_id}/stops", params={}, api_key=api_key))
 
 
-def _fetch_stops_for_direction(api_key: str, direction_id: int) -> list[dict[str, Any]]:
+def _fetch_stops_for_direction(api_key: str, direction_id: int) -> list[Stop]:
     params = {
         "filter[route]": ROUTE_ID,
         "filter[direction_id]": direction_id,
         "fields[stop]": "name",
     }
-    data = _get("/stops", params=params, api_key=api_key)
-    stops = []
-    for stop in data.get("data", []):
-        stops.append(
-            {
-                "sequence": stop.get("attributes", {}).get("sequence"),
-                "id": stop.get("id"),
-                "name": stop.get("attributes", {}).get("name", ""),
-            }
-        )
-    stops.sort(key=lambda s: (s.get("sequence") is None, s.get("sequence") or 0))
-    return stops
+    return _parse_stops(_get("/stops", params=params, api_key=api_key))
 
 
 def _select_pattern(patterns: list[dict[str, Any]], direction_id: int) -> dict[str, Any] | None:
@@ -118,13 +111,13 @@ def _select_pattern(patterns: list[dict[str, Any]], direction_id: int) -> dict[s
     return candidates[0]
 
 
-def _find_stop_ids(stops: list[dict[str, Any]]) -> dict[str, list[str]]:
+def _find_stop_ids(stops: list[Stop]) -> dict[str, list[str]]:
     matches: dict[str, list[str]] = {name: [] for name in TARGET_STOP_NAMES}
     for stop in stops:
-        stop_name = (stop.get("name") or "").lower()
+        stop_name = (stop.name or "").lower()
         for name in TARGET_STOP_NAMES:
             if name.lower() in stop_name:
-                matches[name].append(stop.get("id"))
+                matches[name].append(stop.id)
     return matches
 
 
@@ -158,11 +151,11 @@ def main() -> int:
     for label, pattern in [("Direction 0", direction0), ("Direction 1", direction1)]:
         print(f"\n{label}: {pattern.get('name')}")
         stops = pattern.get("stops", [])
-        missing_sequences = any(stop.get("sequence") is None for stop in stops)
+        missing_sequences = any(stop.sequence is None for stop in stops)
         for idx, stop in enumerate(stops, start=1):
-            seq = stop.get("sequence")
+            seq = stop.sequence
             seq_label = f"{seq:>2}" if isinstance(seq, int) else f"{idx:>2}?"
-            print(f"  {seq_label}. {stop['id']} — {stop['name']}")
+            print(f"  {seq_label}. {stop.id} — {stop.name}")
         if missing_sequences:
             print("  Note: '?' indicates missing sequence from API; index order used instead.")
 
@@ -1,4 +1,5 @@
 import os
+import gzip
 import time
 import json
 import requests
@@ -22,10 +23,15 @@ def fetch(endpoint):
     return r.json()
 
 def log_jsonl(filename, record):
-    with open(filename, "a") as f:
-        f.write(json.dumps(record) + "\n")
+    # Each append is its own closed gzip member, so a crash can only leave the
+    # record being written unfinished; readers skip past it.
+    with gzip.open(filename, "ab", compresslevel=1) as f:
+        f.write((json.dumps(record) + "\n").encode("utf-8"))
 
 def main():
+    # Schedule against a monotonic target so fetch time doesn't stretch the
+    # interval; if a poll overruns, start the next one right away.
+    next_tick = time.monotonic()
     while True:
         ts = datetime.now(timezone.utc).isoformat()
 
@@ -38,21 +44,22 @@ def main():
             )
 
             log_jsonl(
-                "logs/predictions.jsonl",
+                "logs/predictions.jsonl.gz",
                 {"timestamp": ts, "data": predictions}
             )
             log_jsonl(
-                "logs/vehicles.jsonl",
+                "logs/vehicles.jsonl.gz",
                 {"timestamp": ts, "data": vehicles}
             )
 
         except Exception as e:
             log_jsonl(
-                "logs/errors.jsonl",
+                "logs/errors.jsonl.gz",
                 {"timestamp": ts, "error": str(e)}
             )
 
-        time.sleep(INTERVAL)
+        next_tick = max(next_tick + INTERVAL, time.monotonic())
+        time.sleep(max(0.0, next_tick - time.monotonic()))
 
 if __name__ == "__main__":
     main()
@@ -3,10 +3,10 @@
 from __future__ import annotations
 
 import argparse
-import json
 from datetime import datetime
 from typing import Any
 
+from src.data.log_files import iter_jsonl
 from src.data.poller import PollResult
 from src.logic.scorer import assess_poll, UNKNOWN
 from src.rendering import FrameData, TripRow, compose_frame, save_frame
@@ -29,11 +29,8 @@ def _minutes_until(departure_iso: str, now: datetime) -> float:
 
 
 def _load_first_entry(path: str) -> dict[str, Any]:
-    with open(path, "r", encoding="utf-8") as handle:
-        for line in handle:
-            line = line.strip()
-            if line:
-                return json.loads(line)
+    for entry in iter_jsonl(path):
+        return entry
     raise ValueError(f"No entries found in {path}")
 
 
@@ -4,17 +4,32 @@ from __future__ import annotations
 
 import json
 import sys
-from collections import Counter
 from dataclasses import dataclass
 from datetime import datetime
+from pathlib import Path
 from typing import Any, Iterable
 
+import numpy as np
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from src.data.log_files import iter_jsonl
+
 STOP_NEW = "5483"  # Broadway @ Shute St, direction 1
 DIR_NEW = 1
 
 STOP_OLD = "5522"  # previous stop, direction 0
 DIR_OLD = 0
 
+# Minutes-before-departure bins; each bin covers (previous edge, edge].
+_BIN_LABELS = ["<=0", "0-1", "1-3", "3-5", "5-10", "10-15", "15-30", "30-60", ">60"]
+_BIN_EDGES = np.array([0, 1, 3, 5, 10, 15, 30, 60], dtype=np.float64)
+
 
 @dataclass
 class AssignmentStats:
@@ -28,16 +43,13 @@ def _parse_ts(value: str) -> datetime:
     return datetime.fromisoformat(value)
 
 
+_loads = orjson.loads if orjson is not None else json.loads
+
+
 def _iter_lines(path: str) -> Iterable[dict[str, Any]]:
-    with open(path, "r", encoding="utf-8") as handle:
-        for line in handle:
-            line = line.strip()
-            if not line:
-                continue
-            try:
-                yield json.loads(line)
-            except json.JSONDecodeError:
-                continue
+    # Each log line is one poll payload, so a per-line C parser beats a
+    # streaming one; iter_jsonl hands it raw bytes, skipping a decode pass.
+    return iter_jsonl(path, loads=_loads)
 
 
 def _prediction_stop_id(pred: dict[str, Any]) -> str | None:
@@ -95,18 +107,7 @@ def main() -> int:
     count_old = 0
 
     assignment_new = AssignmentStats()
-    assignment_bins = Counter()
-    assignment_bin_edges = [
-        ("<=0", float("-inf"), 0),
-        ("0-1", 0, 1),
-        ("1-3", 1, 3),
-        ("3-5", 3, 5),
-        ("5-10", 5, 10),
-        ("10-15", 10, 15),
-        ("15-30", 15, 30),
-        ("30-60", 30, 60),
-        (">60", 60, float("inf")),
-    ]
+    assignment_minutes: list[float] = []
 
     included_vehicle_hits = 0
     included_vehicle_missing = 0
@@ -152,10 +153,7 @@ def main() -> int:
                     minutes = _minutes_until(dep_iso, ts)
                     if (trip_id, dep_iso) not in first_assignment_seen:
                         first_assignment_seen.add((trip_id, dep_iso))
-                        for label, low, high in assignment_bin_edges:
-                            if low < minutes <= high:
-                                assignment_bins[label] += 1
-                                break
+                        assignment_minutes.append(minutes)
 
                 if vehicle_id:
                     included_vehicle_total += 1
@@ -187,9 +185,14 @@ def main() -> int:
     else:
         print("  No predictions for stop 5483")
 
+    values = np.asarray(assignment_minutes, dtype=np.float64)
+    # digitize puts NaN past the last edge; the old edge loop never counted it.
+    values = values[~np.isnan(values)]
+    bin_index = np.digitize(values, _BIN_EDGES, right=True)
+    bin_counts = np.bincount(bin_index, minlength=len(_BIN_LABELS))
     print("\nMinutes before departure when vehicle gets assigned (first observed):")
-    for label, _, _ in assignment_bin_edges:
-        print(f"  {label:>6}: {assignment_bins[label]}")
+    for label, count in zip(_BIN_LABELS, bin_counts):
+        print(f"  {label:>6}: {count}")
 
     print("\nIncluded vehicle data presence for stop 5483 predictions with vehicle_id:")
     if included_vehicle_total:
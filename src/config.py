@@ -6,7 +6,6 @@ from dataclasses import dataclass
 import os
 from typing import Any
 
-from dotenv import load_dotenv
 import yaml
 
 
@@ -49,6 +48,28 @@ class AppConfig:
     log: LoggingConfig
 
 
+def load_env(path: str = ".env") -> None:
+    """Load KEY=VALUE lines from a .env file without overriding existing variables."""
+    try:
+        with open(path, "r", encoding="utf-8") as handle:
+            lines = handle.readlines()
+    except FileNotFoundError:
+        return
+
+    for line in lines:
+        line = line.strip()
+        if not line or line.startswith("#") or "=" not in line:
+            continue
+        key, value = line.split("=", 1)
+        key = key.strip()
+        if key.startswith("export "):
+            key = key[len("export ") :].strip()
+        value = value.strip()
+        if len(value) >= 2 and value[0] == value[-1] and value[0] in ("'", '"'):
+            value = value[1:-1]
+        os.environ.setdefault(key, value)
+
+
 def _require_key(mapping: dict[str, Any], key: str, context: str) -> Any:
     if key not in mapping:
         raise ValueError(f"Missing required key '{key}' in {context} config")
@@ -57,7 +78,7 @@ def _require_key(mapping: dict[str, Any], key: str, context: str) -> Any:
 
 def load_config(path: str = "config/config.yaml") -> AppConfig:
     """Load application configuration from a YAML file."""
-    load_dotenv()
+    load_env()
     api_key = os.environ.get("MBTA_API_KEY", "")
     try:
         with open(path, "r", encoding="utf-8") as handle:
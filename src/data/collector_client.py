@@ -20,6 +20,36 @@ VEHICLE_FIELDS = (
 )
 SCHEDULE_FIELDS = "departure_time,stop_sequence"
 
+# Query parameters never change between polls, so build them once.
+# requests only reads these mappings; treat them as read-only.
+_PARAMS_BOARDING_PREDICTIONS: dict[str, Any] = {
+    "filter[route]": ROUTE_ID,
+    "filter[stop]": BOARDING_STOP_ID,
+    "filter[direction_id]": DIRECTION_ID,
+}
+_PARAMS_TERMINAL_PREDICTIONS: dict[str, Any] = {
+    "filter[route]": ROUTE_ID,
+    "filter[stop]": TERMINAL_STOP_ID,
+    "filter[direction_id]": DIRECTION_ID,
+    "fields[prediction]": PREDICTION_FIELDS_TERMINAL,
+}
+_PARAMS_VEHICLES: dict[str, Any] = {
+    "filter[route]": ROUTE_ID,
+    "fields[vehicle]": VEHICLE_FIELDS,
+}
+_PARAMS_TERMINAL_SCHEDULES: dict[str, Any] = {
+    "filter[route]": ROUTE_ID,
+    "filter[stop]": TERMINAL_STOP_ID,
+    "filter[direction_id]": DIRECTION_ID,
+    "fields[schedule]": SCHEDULE_FIELDS,
+}
+_PARAMS_BOARDING_SCHEDULES: dict[str, Any] = {
+    "filter[route]": ROUTE_ID,
+    "filter[stop]": BOARDING_STOP_ID,
+    "filter[direction_id]": DIRECTION_ID,
+    "fields[schedule]": SCHEDULE_FIELDS,
+}
+
 
 @dataclass(frozen=True)
 class CollectorSnapshot:
@@ -28,64 +58,48 @@ class CollectorSnapshot:
     vehicles: list[dict[str, Any]]
 
 
+# fetch_snapshot issues three requests back to back every poll; a shared
+# session lets them (and later polls) reuse one keep-alive connection.
+_SESSION = requests.Session()
+
+
 def _get(path: str, params: dict[str, Any], api_key: str) -> dict[str, Any]:
     url = f"{MBTA_API_BASE}{path}"
-    resp = requests.get(url, params=params, headers={"x-api-key": api_key}, timeout=10)
+    resp = _SESSION.get(url, params=params, headers={"x-api-key": api_key}, timeout=10)
     if resp.status_code != 200:
         raise RuntimeError(f"HTTP {resp.status_code}: {resp.text}")
     return resp.json()
 
 
+def _response_resources(response: dict[str, Any]) -> list[dict[str, Any]]:
+    # Filter a response's data array to resource objects once here so
+    # consumers can skip the check.
+    return [item for item in response.get("data", []) or [] if isinstance(item, dict)]
+
+
 def fetch_boarding_predictions(api_key: str) -> list[dict[str, Any]]:
-    params = {
-        "filter[route]": ROUTE_ID,
-        "filter[stop]": BOARDING_STOP_ID,
-        "filter[direction_id]": DIRECTION_ID,
-    }
-    data = _get("/predictions", params=params, api_key=api_key)
-    return data.get("data", []) or []
+    data = _get("/predictions", _PARAMS_BOARDING_PREDICTIONS, api_key)
+    return _response_resources(data)
 
 
 def fetch_terminal_predictions(api_key: str) -> list[dict[str, Any]]:
-    params = {
-        "filter[route]": ROUTE_ID,
-        "filter[stop]": TERMINAL_STOP_ID,
-        "filter[direction_id]": DIRECTION_ID,
-        "fields[prediction]": PREDICTION_FIELDS_TERMINAL,
-    }
-    data = _get("/predictions", params=params, api_key=api_key)
-    return data.get("data", []) or []
+    data = _get("/predictions", _PARAMS_TERMINAL_PREDICTIONS, api_key)
+    return _response_resources(data)
 
 
 def fetch_vehicles(api_key: str) -> list[dict[str, Any]]:
-    params = {
-        "filter[route]": ROUTE_ID,
-        "fields[vehicle]": VEHICLE_FIELDS,
-    }
-    data = _get("/vehicles", params=params, api_key=api_key)
-    return data.get("data", []) or []
+    data = _get("/vehicles", _PARAMS_VEHICLES, api_key)
+    return _response_resources(data)
 
 
 def fetch_schedules(api_key: str) -> list[dict[str, Any]]:
-    params = {
-        "filter[route]": ROUTE_ID,
-        "filter[stop]": TERMINAL_STOP_ID,
-        "filter[direction_id]": DIRECTION_ID,
-        "fields[schedule]": SCHEDULE_FIELDS,
-    }
-    data = _get("/schedules", params=params, api_key=api_key)
-    return data.get("data", []) or []
+    data = _get("/schedules", _PARAMS_TERMINAL_SCHEDULES, api_key)
+    return _response_resources(data)
 
 
 def fetch_boarding_schedules(api_key: str) -> list[dict[str, Any]]:
-    params = {
-        "filter[route]": ROUTE_ID,
-        "filter[stop]": BOARDING_STOP_ID,
-        "filter[direction_id]": DIRECTION_ID,
-        "fields[schedule]": SCHEDULE_FIELDS,
-    }
-    data = _get("/schedules", params=params, api_key=api_key)
-    return data.get("data", []) or []
+    data = _get("/schedules", _PARAMS_BOARDING_SCHEDULES, api_key)
+    return _response_resources(data)
 
 
 def fetch_snapshot(api_key: str) -> CollectorSnapshot:
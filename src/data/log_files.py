@@ -0,0 +1,106 @@
+"""Readers for the append-only JSONL poll logs, plain or gzip-compressed."""
+
+from __future__ import annotations
+
+import gzip
+import json
+import mmap
+import os
+from pathlib import Path
+from typing import IO, Any, Callable, Iterator
+import zlib
+
+_GZIP_MAGIC = b"\x1f\x8b\x08"
+# Small enough that each one-record member does not copy much trailing input.
+_READ_CHUNK = 1 << 16
+
+
+def open_log(path: str | Path, mode: str = "rb") -> IO[Any]:
+    """Open a log file, transparently decompressing ``.gz`` paths."""
+    if str(path).endswith(".gz"):
+        return gzip.open(path, mode)
+    return open(path, mode)
+
+
+def _salvage_member(member_bytes: bytes) -> bytes:
+    """Return what decompresses cleanly from the front of a damaged member."""
+    member = zlib.decompressobj(wbits=31)
+    recovered = []
+    # Byte at a time, so output flushed right before the damage is kept.
+    for index in range(len(member_bytes)):
+        try:
+            recovered.append(member.decompress(member_bytes[index : index + 1]))
+        except zlib.error:
+            break
+    return b"".join(recovered)
+
+
+def _iter_gzip_chunks(data: mmap.mmap) -> Iterator[bytes]:
+    """Decompress each gzip member in turn, resuming past damaged ones."""
+    pos = 0
+    end = len(data)
+    with memoryview(data) as view:
+        while pos < end:
+            start = pos
+            emitted = 0
+            member = zlib.decompressobj(wbits=31)
+            try:
+                while not member.eof and pos < end:
+                    chunk = view[pos : pos + _READ_CHUNK]
+                    pos += len(chunk)
+                    output = member.decompress(chunk)
+                    emitted += len(output)
+                    yield output
+            except zlib.error:
+                # A member cut short by a crash runs into the member appended
+                # after the restart; keep what it held, then pick up again at
+                # the next gzip header.
+                yield _salvage_member(data[start:pos])[emitted:] + b"\n"
+                pos = data.find(_GZIP_MAGIC, start + 1)
+                if pos < 0:
+                    return
+                continue
+            if not member.eof:
+                return
+            pos -= len(member.unused_data)
+
+
+def _iter_gzip_lines(path: str | Path) -> Iterator[bytes]:
+    with open(path, "rb") as handle:
+        if os.fstat(handle.fileno()).st_size == 0:
+            return
+        with mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            pending = b""
+            for chunk in _iter_gzip_chunks(data):
+                lines = (pending + chunk).split(b"\n")
+                pending = lines.pop()
+                yield from lines
+            if pending:
+                yield pending
+
+
+def iter_jsonl(path: str | Path, loads: Callable[[bytes], Any] = json.loads) -> Iterator[Any]:
+    """Yield one parsed record per line, skipping blank and unparseable lines.
+
+    A gzip member left unfinished by a crash loses only the records it held:
+    reading resumes at the next member, as a truncated plaintext line is
+    simply skipped.
+    """
+    if str(path).endswith(".gz"):
+        lines = _iter_gzip_lines(path)
+    else:
+        lines = open(path, "rb")
+    try:
+        for line in lines:
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                yield loads(line)
+            except ValueError:
+                continue
+    finally:
+        lines.close()
+
+
+__all__ = ["iter_jsonl", "open_log"]
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import sys
 from typing import Any
 
 import requests
@@ -9,16 +10,32 @@ import requests
 MBTA_API_BASE = "https://api-v3.mbta.com"
 
 
+def _resources(items: Any) -> list[dict]:
+    """Keep only JSON:API resource objects; downstream code relies on dicts."""
+    return [item for item in items or [] if isinstance(item, dict)]
+
+
 class MBTAClientError(Exception):
     """Raised when an MBTA API request fails or returns a non-200 response."""
 
 
 class MBTAClient:
-    """Thin wrapper around the MBTA v3 API using requests."""
+    """Thin wrapper around the MBTA v3 API using a pooled requests session."""
 
-    def __init__(self, api_key: str) -> None:
-        self._api_key = api_key
+    def __init__(self, api_key: str, *, session: requests.Session | None = None) -> None:
         self._timeout_seconds = 10
+        # One pooled session keeps the TLS connection alive between polls
+        # instead of reconnecting on every request. Callers may supply their
+        # own, e.g. to share a pool or to stub the transport in tests, so the
+        # key is sent per request rather than set on a session we may not own.
+        self._owns_session = session is None
+        self._session = session if session is not None else requests.Session()
+        self._headers = {"x-api-key": api_key}
+
+    def close(self) -> None:
+        """Close pooled connections, unless the session was supplied by the caller."""
+        if self._owns_session:
+            self._session.close()
 
     def get_predictions(
         self, route_id: str, stop_id: str, direction_id: int
@@ -31,21 +48,31 @@ class MBTAClient:
             "include": "vehicle",
         }
         response_json = self._get("/predictions", params=params)
-        predictions = response_json.get("data", [])
-        vehicles = response_json.get("included", [])
+        predictions = _resources(response_json.get("data"))
+        vehicles = _resources(response_json.get("included"))
+        for prediction in predictions:
+            attributes = prediction.get("attributes")
+            if not isinstance(attributes, dict):
+                continue
+            # Interned values share identity with the scorer's "CANCELLED"
+            # literal, so equality checks hit CPython's identity fast path.
+            relationship = attributes.get("schedule_relationship")
+            if isinstance(relationship, str):
+                attributes["schedule_relationship"] = sys.intern(relationship)
         return predictions, vehicles
 
     def get_vehicles(self, route_id: str) -> list[dict]:
         """Fetch vehicles for a route; returns the raw data array."""
         params = {"filter[route]": route_id}
         response_json = self._get("/vehicles", params=params)
-        return response_json.get("data", [])
+        return _resources(response_json.get("data"))
 
     def _get(self, path: str, params: dict[str, Any] | None = None) -> dict[str, Any]:
         url = f"{MBTA_API_BASE}{path}"
-        headers = {"x-api-key": self._api_key}
         try:
-            response = requests.get(url, headers=headers, params=params, timeout=self._timeout_seconds)
+            response = self._session.get(
+                url, params=params, headers=self._headers, timeout=self._timeout_seconds
+            )
         except requests.RequestException as exc:
             raise MBTAClientError(f"MBTA API request failed: {exc}") from exc
 
@@ -2,21 +2,75 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from datetime import datetime
+import logging
 import threading
 import time
+from typing import Callable
 
 from src.data.mbta_client import MBTAClient, MBTAClientError
 
+logger = logging.getLogger(__name__)
+
+# (minutes until the soonest departure, poll interval seconds), checked in order.
+ADAPTIVE_POLL_INTERVALS = ((20.0, 60.0), (10.0, 30.0), (5.0, 15.0))
+IMMINENT_POLL_INTERVAL_SECONDS = 5.0
+MAX_BACKOFF_SECONDS = 120.0
+
+HISTORY_SIZE = 16  # power of two so ring slots are a mask, not a modulo
+_HISTORY_MASK = HISTORY_SIZE - 1
+
 
 @dataclass(frozen=True)
 class PollResult:
-    """Snapshot of the latest MBTA API poll attempt."""
+    """Snapshot of the latest MBTA API poll attempt.
+
+    Alongside the raw payloads, per-prediction columns (aligned with
+    ``predictions``) and per-vehicle indexes are derived once at construction
+    so scorers can index them instead of walking nested dicts every frame.
+    Timestamps are parsed to epoch seconds here so no caller re-parses them.
+    ``predictions`` and ``vehicles`` must be lists of resource dicts (the API
+    clients filter them at parse time). Vehicles without an id are left out of
+    the indexes, and null attribute or relationship objects read as empty.
+    """
 
     predictions: list[dict]
     vehicles: list[dict]
     fetched_at: float
     error: str | None
+    vehicles_by_id: dict[str, dict] = field(init=False, repr=False, compare=False)
+    vehicle_updated_ts: dict[str, float] = field(init=False, repr=False, compare=False)
+    pred_vehicle_ids: list[str | None] = field(init=False, repr=False, compare=False)
+    pred_cancelled: list[bool] = field(init=False, repr=False, compare=False)
+    pred_departure_ts: list[float | None] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        vehicles_by_id = {v["id"]: v for v in self.vehicles if v.get("id")}
+        vehicle_updated_ts = {}
+        for vehicle_id, vehicle in vehicles_by_id.items():
+            updated_ts = parse_timestamp((vehicle.get("attributes") or {}).get("updated_at"))
+            if updated_ts is not None:
+                vehicle_updated_ts[vehicle_id] = updated_ts
+
+        pred_vehicle_ids: list[str | None] = []
+        pred_cancelled: list[bool] = []
+        pred_departure_ts: list[float | None] = []
+        for prediction in self.predictions:
+            attributes = prediction.get("attributes") or {}
+            relationships = prediction.get("relationships") or {}
+            vehicle_rel = (relationships.get("vehicle") or {}).get("data")
+            pred_vehicle_ids.append(vehicle_rel.get("id") if isinstance(vehicle_rel, dict) else None)
+            pred_cancelled.append(attributes.get("schedule_relationship") == "CANCELLED")
+            pred_departure_ts.append(
+                parse_timestamp(attributes.get("departure_time") or attributes.get("arrival_time"))
+            )
+
+        object.__setattr__(self, "vehicles_by_id", vehicles_by_id)
+        object.__setattr__(self, "vehicle_updated_ts", vehicle_updated_ts)
+        object.__setattr__(self, "pred_vehicle_ids", pred_vehicle_ids)
+        object.__setattr__(self, "pred_cancelled", pred_cancelled)
+        object.__setattr__(self, "pred_departure_ts", pred_departure_ts)
 
 
 class MBTAPoller:
@@ -29,40 +83,105 @@ class MBTAPoller:
         stop_id: str,
         direction_id: int,
         poll_interval_seconds: int,
+        *,
+        on_result: Callable[[PollResult], None] | None = None,
     ) -> None:
         self._client = client
         self._route_id = route_id
         self._stop_id = stop_id
         self._direction_id = direction_id
         self._poll_interval_seconds = poll_interval_seconds
+        self._current_interval: float = poll_interval_seconds
+        # Called on the poll thread after each result is published.
+        self._on_result = on_result
+        # PollResult is immutable and swapped in with a single attribute store,
+        # so readers never observe a partial update and need no lock.
         self._latest: PollResult | None = None
-        self._lock = threading.Lock()
+        # Single-producer ring of recent results. Only the poll thread writes;
+        # readers tolerate a slot being overwritten mid-read.
+        self._ring: list[PollResult | None] = [None] * HISTORY_SIZE
+        self._ring_head = 0
         self._stop_event = threading.Event()
+        self._wake_event = threading.Event()
         self._thread: threading.Thread | None = None
 
     def get_latest(self) -> PollResult | None:
         """Return the most recent poll result, if any."""
-        with self._lock:
-            return self._latest
+        return self._latest
+
+    def get_history(self, n: int = HISTORY_SIZE) -> list[PollResult]:
+        """Return up to n recent poll results, newest first."""
+        head = self._ring_head
+        count = min(n, head, HISTORY_SIZE)
+        return [self._ring[(head - i - 1) & _HISTORY_MASK] for i in range(count)]
 
     def start(self) -> None:
         """Start the background polling thread."""
         if self._thread and self._thread.is_alive():
             return
         self._stop_event.clear()
+        self._wake_event.clear()
         self._thread = threading.Thread(target=self._run_loop, daemon=True)
         self._thread.start()
 
     def stop(self) -> None:
         """Signal the polling thread to stop."""
         self._stop_event.set()
+        self._wake_event.set()
+
+    def trigger_refresh(self) -> None:
+        """Ask the polling thread to fetch now instead of waiting out the interval."""
+        self._wake_event.set()
 
     def _run_loop(self) -> None:
         while not self._stop_event.is_set():
-            result = self._fetch_once()
-            with self._lock:
-                self._latest = result
-            self._stop_event.wait(timeout=self._poll_interval_seconds)
+            try:
+                result = self._fetch_once()
+            except Exception as exc:
+                # A malformed payload must not end the daemon thread; report it
+                # as a failed poll so the display ages out and we back off.
+                logger.exception("Unexpected error while polling MBTA")
+                result = PollResult(
+                    predictions=[],
+                    vehicles=[],
+                    fetched_at=time.time(),
+                    error=f"Unexpected error: {exc}",
+                )
+            self._publish(result)
+            self._current_interval = self._next_interval(result)
+            # stop() and trigger_refresh() both set the wake event, so a single
+            # wait covers either reason to cut the interval short.
+            self._wake_event.wait(timeout=self._current_interval)
+            self._wake_event.clear()
+
+    def _publish(self, result: PollResult) -> None:
+        self._ring[self._ring_head & _HISTORY_MASK] = result
+        self._ring_head += 1
+        self._latest = result
+        if self._on_result is not None:
+            try:
+                self._on_result(result)
+            except Exception:
+                logger.exception("on_result callback failed")
+
+    def _next_interval(self, result: PollResult) -> float:
+        """Pick the next wait: back off on errors, poll faster as departures near."""
+        if result.error:
+            return min(self._current_interval * 2, MAX_BACKOFF_SECONDS)
+
+        departures = [
+            ts
+            for ts, cancelled in zip(result.pred_departure_ts, result.pred_cancelled)
+            if ts is not None and not cancelled
+        ]
+        if not departures:
+            return self._poll_interval_seconds
+
+        soonest = (min(departures) - result.fetched_at) / 60.0
+        for threshold, interval in ADAPTIVE_POLL_INTERVALS:
+            if soonest >= threshold:
+                return interval
+        return IMMINENT_POLL_INTERVAL_SECONDS
 
     def _fetch_once(self) -> PollResult:
         try:
@@ -84,4 +203,14 @@ class MBTAPoller:
             )
 
 
-__all__ = ["PollResult", "MBTAPoller"]
+def parse_timestamp(value: str | None) -> float | None:
+    """Parse an MBTA ISO 8601 timestamp to epoch seconds, or None if unusable."""
+    if not value:
+        return None
+    try:
+        return datetime.fromisoformat(value).timestamp()
+    except (TypeError, ValueError):
+        return None
+
+
+__all__ = ["PollResult", "MBTAPoller", "parse_timestamp"]
@@ -42,7 +42,6 @@ class MatrixDisplay:
                 f"({geometry.panel_height})."
             )
 
-        self._np = np
         self._geometry = geometry
         self._panel_count = geometry.width // geometry.panel_width
 
@@ -67,6 +66,10 @@ class MatrixDisplay:
             rotation=piomatter.Orientation.Normal,
         )
         self._framebuffer = np.zeros((geometry.height, geometry.width, 3), dtype=np.uint8)
+        # Flat byte view over the framebuffer, created once so each frame is a
+        # single memcpy with no temporary arrays.
+        self._framebuffer_bytes = memoryview(self._framebuffer).cast("B")
+        self._last_frame: bytes | None = None
         matrix_kwargs = {
             "colorspace": piomatter.Colorspace.RGB888Packed,
             "pinout": piomatter.Pinout.AdafruitMatrixBonnet,
@@ -98,9 +101,17 @@ class MatrixDisplay:
                 f"Expected {(self._geometry.width, self._geometry.height)}, got {image.size}."
             )
 
-        rgb = image.convert("RGB")
-        self._framebuffer[:] = self._np.asarray(rgb, dtype=self._np.uint8)
+        # compose_frame already returns RGB; skip convert() and copy the raw
+        # bytes straight into the framebuffer.
+        rgb = image if image.mode == "RGB" else image.convert("RGB")
+        frame = rgb.tobytes()
+        # The matrix keeps scanning the last frame; skip the copy and flush
+        # when nothing changed.
+        if frame == self._last_frame:
+            return
+        self._framebuffer_bytes[:] = frame
         self._matrix.show()
+        self._last_frame = frame
 
 
 __all__ = ["MatrixDisplay", "MatrixGeometry"]
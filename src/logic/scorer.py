@@ -3,18 +3,25 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+import logging
 import time
+from typing import Callable
 
-from src.data.poller import PollResult
+from src.data.poller import MBTAPoller, PollResult, parse_timestamp
 
 INBOUND_END_SEQ = 44
 OUTBOUND_END_SEQ = 41
 INBOUND_DURATION_MIN = 66.0
 OUTBOUND_DURATION_MIN = 54.0
 
+_INBOUND_MIN_PER_STOP = INBOUND_DURATION_MIN / INBOUND_END_SEQ
+_OUTBOUND_MIN_PER_STOP = OUTBOUND_DURATION_MIN / OUTBOUND_END_SEQ
+
 FEASIBILITY_GOOD_BUFFER_MIN = 10.0
 FEASIBILITY_RISKY_BUFFER_MIN = 20.0
 
+logger = logging.getLogger(__name__)
+
 
 GOOD = "GOOD"
 RISKY = "RISKY"
@@ -22,7 +29,7 @@ BAD = "BAD"
 UNKNOWN = "UNKNOWN"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ReliabilityAssessment:
     """Result of reliability scoring for the next inbound departure."""
 
@@ -30,29 +37,68 @@ class ReliabilityAssessment:
     reason: str
 
 
-def assess_reliability(prediction: dict, vehicles: list[dict]) -> ReliabilityAssessment:
-    """Assess reliability for a single prediction using vehicle data."""
-    attributes = prediction.get("attributes", {})
+# Assessments with fixed reasons are shared instances; they are immutable, so
+# every scorer can hand out the same object instead of allocating per call.
+_NO_ACTIVE_PREDICTIONS = ReliabilityAssessment(UNKNOWN, "No active predictions")
+_NO_ASSIGNED_VEHICLE = ReliabilityAssessment(RISKY, "Prediction has no assigned vehicle")
+_VEHICLE_NOT_INCLUDED = ReliabilityAssessment(RISKY, "Assigned vehicle missing from include data")
+_VEHICLE_NOT_UPDATED = ReliabilityAssessment(RISKY, "Vehicle has no update timestamp")
+_VEHICLE_UPDATE_UNREADABLE = ReliabilityAssessment(RISKY, "Vehicle update timestamp unreadable")
+_VEHICLE_ASSIGNED = ReliabilityAssessment(GOOD, "Vehicle assigned with recent data")
+
+_CANCELLED = ReliabilityAssessment(UNKNOWN, "Cancelled")
+_VEHICLE_MISSING = ReliabilityAssessment(RISKY, "Assigned vehicle missing")
+_DEPARTED = ReliabilityAssessment(GOOD, "Departed")
+_VEHICLE_MISSING_POSITION = ReliabilityAssessment(RISKY, "Vehicle missing position")
+
+_AT_LINDEN = ReliabilityAssessment(GOOD, "At Linden")
+_FEASIBLE = ReliabilityAssessment(GOOD, "Feasible")
+_TIGHT_TIMING = ReliabilityAssessment(RISKY, "Tight timing")
+_UNLIKELY = ReliabilityAssessment(BAD, "Unlikely to make it")
+
+# (far, soon, imminent) assessments for trips scored only by lead time.
+_LEAD_TIME_ASSESSMENTS = {
+    label: (
+        ReliabilityAssessment(UNKNOWN, label),
+        ReliabilityAssessment(RISKY, f"{label} soon"),
+        ReliabilityAssessment(BAD, f"{label} imminent"),
+    )
+    for label in ("Scheduled", "Unassigned")
+}
+
+
+def assess_reliability(prediction: dict, vehicles_by_id: dict[str, dict]) -> ReliabilityAssessment:
+    """Assess reliability for a single prediction using vehicles indexed by id."""
+    attributes = prediction.get("attributes") or {}
     if attributes.get("schedule_relationship") == "CANCELLED":
-        return ReliabilityAssessment(UNKNOWN, "No active predictions")
+        return _NO_ACTIVE_PREDICTIONS
 
-    relationships = prediction.get("relationships", {})
-    vehicle_rel = relationships.get("vehicle", {}).get("data")
+    relationships = prediction.get("relationships") or {}
+    vehicle_rel = (relationships.get("vehicle") or {}).get("data")
     vehicle_id = vehicle_rel.get("id") if isinstance(vehicle_rel, dict) else None
 
-    if not vehicle_id:
-        return ReliabilityAssessment(RISKY, "Prediction has no assigned vehicle")
+    vehicle = vehicles_by_id.get(vehicle_id) if vehicle_id else None
+    updated_ts = parse_timestamp(_updated_at(vehicle)) if vehicle else None
+    return _vehicle_assessment(vehicle_id, vehicle, updated_ts)
 
-    vehicles_by_id = {v.get("id"): v for v in vehicles if isinstance(v, dict)}
-    vehicle = vehicles_by_id.get(vehicle_id)
-    if not vehicle:
-        return ReliabilityAssessment(RISKY, "Assigned vehicle missing from include data")
 
-    v_updated = vehicle.get("attributes", {}).get("updated_at")
-    if not v_updated:
-        return ReliabilityAssessment(RISKY, "Vehicle has no update timestamp")
+def _updated_at(vehicle: dict) -> str | None:
+    return (vehicle.get("attributes") or {}).get("updated_at")
 
-    return ReliabilityAssessment(GOOD, "Vehicle assigned with recent data")
+
+def _vehicle_assessment(
+    vehicle_id: str | None, vehicle: dict | None, updated_ts: float | None
+) -> ReliabilityAssessment:
+    """Grade a live prediction by its vehicle assignment, shared by both assessors."""
+    if not vehicle_id:
+        return _NO_ASSIGNED_VEHICLE
+    if not vehicle:
+        return _VEHICLE_NOT_INCLUDED
+    if updated_ts is None:
+        # Only this uncommon path looks back at the raw value, to tell a
+        # missing timestamp from one that failed to parse.
+        return _VEHICLE_UPDATE_UNREADABLE if _updated_at(vehicle) else _VEHICLE_NOT_UPDATED
+    return _VEHICLE_ASSIGNED
 
 
 def score_trip(
@@ -68,140 +114,65 @@ def score_trip(
     time_needed = None
 
     if prediction is None:
-        if minutes_until > 20:
-            assessment = ReliabilityAssessment(UNKNOWN, "Scheduled")
-        elif 10 <= minutes_until <= 20:
-            assessment = ReliabilityAssessment(RISKY, "Scheduled soon")
+        assessment = _lead_time_assessment("Scheduled", minutes_until)
+    elif prediction.get("attributes", {}).get("schedule_relationship") == "CANCELLED":
+        assessment = _CANCELLED
+    else:
+        relationships = prediction.get("relationships", {})
+        trip_rel = relationships.get("trip") or {}
+        trip_data = trip_rel.get("data") or {}
+        trip_id = trip_data.get("id")
+
+        vehicle_rel = relationships.get("vehicle", {}).get("data")
+        vehicle_id = vehicle_rel.get("id") if isinstance(vehicle_rel, dict) else None
+        vehicle = vehicles.get(vehicle_id) if vehicle_id else None
+
+        if not vehicle_id:
+            assessment = _lead_time_assessment("Unassigned", minutes_until)
+        elif not vehicle:
+            assessment = _VEHICLE_MISSING
         else:
-            assessment = ReliabilityAssessment(BAD, "Scheduled imminent")
-        print(
-            "score_trip",
-            {
-                "trip_id": trip_id,
-                "vehicle_id": vehicle_id,
-                "direction_id": direction_id,
-                "current_stop_sequence": seq,
-                "time_needed": time_needed,
-                "minutes_until": round(minutes_until, 2),
-                "score": assessment.classification,
-            },
-            flush=True,
-        )
-        return assessment
-
-    attributes = prediction.get("attributes", {})
-    if attributes.get("schedule_relationship") == "CANCELLED":
-        assessment = ReliabilityAssessment(UNKNOWN, "Cancelled")
-        print(
-            "score_trip",
-            {
-                "trip_id": trip_id,
-                "vehicle_id": vehicle_id,
-                "direction_id": direction_id,
-                "current_stop_sequence": seq,
-                "time_needed": time_needed,
-                "minutes_until": round(minutes_until, 2),
-                "score": assessment.classification,
-            },
-            flush=True,
-        )
-        return assessment
-
-    relationships = prediction.get("relationships", {})
-    trip_rel = relationships.get("trip") or {}
-    trip_data = trip_rel.get("data") or {}
-    trip_id = trip_data.get("id")
-
-    vehicle_rel = relationships.get("vehicle", {}).get("data")
-    vehicle_id = vehicle_rel.get("id") if isinstance(vehicle_rel, dict) else None
+            attrs_v = vehicle.get("attributes", {})
+            direction_id = attrs_v.get("direction_id")
+            seq = attrs_v.get("current_stop_sequence")
+            if direction_id == 1 and isinstance(seq, int) and 1 < seq <= 10:
+                time_needed = 0.0
+                assessment = _DEPARTED
+            else:
+                time_needed = estimate_time_to_linden(vehicle)
+                if time_needed is None:
+                    assessment = _VEHICLE_MISSING_POSITION
+                else:
+                    assessment = score_feasibility(time_needed, minutes_until)
+
+    _log_score(trip_id, vehicle_id, direction_id, seq, time_needed, minutes_until, assessment)
+    return assessment
 
-    if not vehicle_id:
-        if minutes_until > 20:
-            assessment = ReliabilityAssessment(UNKNOWN, "Unassigned")
-        elif 10 <= minutes_until <= 20:
-            assessment = ReliabilityAssessment(RISKY, "Unassigned soon")
-        else:
-            assessment = ReliabilityAssessment(BAD, "Unassigned imminent")
-        print(
-            "score_trip",
-            {
-                "trip_id": trip_id,
-                "vehicle_id": vehicle_id,
-                "direction_id": direction_id,
-                "current_stop_sequence": seq,
-                "time_needed": time_needed,
-                "minutes_until": round(minutes_until, 2),
-                "score": assessment.classification,
-            },
-            flush=True,
-        )
-        return assessment
-
-    vehicle = vehicles.get(vehicle_id)
-    if not vehicle:
-        assessment = ReliabilityAssessment(RISKY, "Assigned vehicle missing")
-        print(
-            "score_trip",
-            {
-                "trip_id": trip_id,
-                "vehicle_id": vehicle_id,
-                "direction_id": direction_id,
-                "current_stop_sequence": seq,
-                "time_needed": time_needed,
-                "minutes_until": round(minutes_until, 2),
-                "score": assessment.classification,
-            },
-            flush=True,
-        )
-        return assessment
-
-    attrs_v = vehicle.get("attributes", {}) if isinstance(vehicle, dict) else {}
-    direction_id = attrs_v.get("direction_id")
-    seq = attrs_v.get("current_stop_sequence")
-    if direction_id == 1 and isinstance(seq, int) and 1 < seq <= 10:
-        assessment = ReliabilityAssessment(GOOD, "Departed")
-        print(
-            "score_trip",
-            {
-                "trip_id": trip_id,
-                "vehicle_id": vehicle_id,
-                "direction_id": direction_id,
-                "current_stop_sequence": seq,
-                "time_needed": 0.0,
-                "minutes_until": round(minutes_until, 2),
-                "score": assessment.classification,
-            },
-            flush=True,
-        )
-        return assessment
-
-    time_needed = estimate_time_to_linden(vehicle)
-    if time_needed is None:
-        assessment = ReliabilityAssessment(RISKY, "Vehicle missing position")
-        attrs_v = vehicle.get("attributes", {}) if isinstance(vehicle, dict) else {}
-        direction_id = attrs_v.get("direction_id")
-        seq = attrs_v.get("current_stop_sequence")
-        print(
-            "score_trip",
-            {
-                "trip_id": trip_id,
-                "vehicle_id": vehicle_id,
-                "direction_id": direction_id,
-                "current_stop_sequence": seq,
-                "time_needed": time_needed,
-                "minutes_until": round(minutes_until, 2),
-                "score": assessment.classification,
-            },
-            flush=True,
-        )
-        return assessment
-
-    assessment = score_feasibility(time_needed, minutes_until)
-    attrs_v = vehicle.get("attributes", {}) if isinstance(vehicle, dict) else {}
-    direction_id = attrs_v.get("direction_id")
-    seq = attrs_v.get("current_stop_sequence")
-    print(
-        "score_trip",
+
+def _lead_time_assessment(label: str, minutes_until: float) -> ReliabilityAssessment:
+    """Score a trip with no usable vehicle purely by how soon it departs."""
+    far, soon, imminent = _LEAD_TIME_ASSESSMENTS[label]
+    if minutes_until > 20:
+        return far
+    if 10 <= minutes_until <= 20:
+        return soon
+    return imminent
+
+
+def _log_score(
+    trip_id: str | None,
+    vehicle_id: str | None,
+    direction_id: int | None,
+    seq: int | None,
+    time_needed: float | None,
+    minutes_until: float,
+    assessment: ReliabilityAssessment,
+) -> None:
+    # score_trip runs per trip per frame; only build the payload when it is wanted.
+    if not logger.isEnabledFor(logging.DEBUG):
+        return
+    logger.debug(
+        "score_trip %r",
         {
             "trip_id": trip_id,
             "vehicle_id": vehicle_id,
@@ -211,9 +182,7 @@ def score_trip(
             "minutes_until": round(minutes_until, 2),
             "score": assessment.classification,
         },
-        flush=True,
     )
-    return assessment
 
 
 def estimate_time_to_linden(vehicle: dict) -> float | None:
@@ -221,54 +190,104 @@ def estimate_time_to_linden(vehicle: dict) -> float | None:
     attrs = vehicle.get("attributes", {}) if isinstance(vehicle, dict) else {}
     direction_id = attrs.get("direction_id")
     seq = attrs.get("current_stop_sequence")
-    if direction_id is None or seq is None or not isinstance(seq, int):
+    if direction_id is None or type(seq) is not int:
         return None
 
     if seq == 1:
         return 0.0
 
-    if direction_id == 1:
-        remaining_inbound = max(INBOUND_END_SEQ - seq, 0) / INBOUND_END_SEQ * INBOUND_DURATION_MIN
-        return remaining_inbound + OUTBOUND_DURATION_MIN
+    estimate = _MINUTES_TO_LINDEN.get(direction_id)
+    return estimate(seq) if estimate is not None else None
+
+
+def _inbound_minutes_to_linden(seq: int) -> float:
+    # Finish the inbound run, then ride the full outbound run back to Linden.
+    return max(INBOUND_END_SEQ - seq, 0) * _INBOUND_MIN_PER_STOP + OUTBOUND_DURATION_MIN
 
-    if direction_id == 0:
-        remaining_outbound = max(OUTBOUND_END_SEQ - seq, 0) / OUTBOUND_END_SEQ * OUTBOUND_DURATION_MIN
-        return remaining_outbound
 
-    return None
+def _outbound_minutes_to_linden(seq: int) -> float:
+    return max(OUTBOUND_END_SEQ - seq, 0) * _OUTBOUND_MIN_PER_STOP
+
+
+_MINUTES_TO_LINDEN = {
+    1: _inbound_minutes_to_linden,
+    0: _outbound_minutes_to_linden,
+}
 
 
 def score_feasibility(time_needed: float, time_available: int) -> ReliabilityAssessment:
     """Score feasibility using time needed vs time available."""
     if time_needed <= 0:
-        return ReliabilityAssessment(GOOD, "At Linden")
+        return _AT_LINDEN
     if time_needed <= time_available - FEASIBILITY_GOOD_BUFFER_MIN:
-        return ReliabilityAssessment(GOOD, "Feasible")
+        return _FEASIBLE
     if time_needed <= time_available + FEASIBILITY_RISKY_BUFFER_MIN:
-        return ReliabilityAssessment(RISKY, "Tight timing")
-    return ReliabilityAssessment(BAD, "Unlikely to make it")
+        return _TIGHT_TIMING
+    return _UNLIKELY
+
+
+def _assess_predictions(result: PollResult) -> ReliabilityAssessment:
+    """Score the first non-cancelled prediction from PollResult's precomputed columns."""
+    try:
+        index = result.pred_cancelled.index(False)
+    except ValueError:
+        return _NO_ACTIVE_PREDICTIONS
 
+    # Feed the shared ladder from the precomputed columns, not nested dict lookups.
+    vehicle_id = result.pred_vehicle_ids[index]
+    vehicle = result.vehicles_by_id.get(vehicle_id) if vehicle_id else None
+    return _vehicle_assessment(vehicle_id, vehicle, result.vehicle_updated_ts.get(vehicle_id))
 
-def assess_poll(result: PollResult) -> ReliabilityAssessment:
-    """Assess reliability for the first non-cancelled prediction in a PollResult."""
+
+_last_assessed: tuple[PollResult | None, ReliabilityAssessment] = (None, _NO_ACTIVE_PREDICTIONS)
+# The last result a refresh was requested for; render loops assess the same
+# result every frame, and waking the poller on each frame would cut its wait short.
+_last_refresh_requested: PollResult | None = None
+
+
+def assess_poll(
+    result: PollResult,
+    poller: MBTAPoller | None = None,
+    *,
+    now_fn: Callable[[], float] = time.time,
+) -> ReliabilityAssessment:
+    """Assess reliability for the first non-cancelled prediction in a PollResult.
+
+    When a poller is given, it is woken once per result as soon as the data
+    starts aging, and aging data that still scores GOOD is served as-is while
+    it refreshes (stale-while-revalidate). now_fn supplies the clock used to
+    age the data.
+    """
     if not result.predictions:
-        return ReliabilityAssessment(UNKNOWN, "No active predictions")
+        return _NO_ACTIVE_PREDICTIONS
 
     if result.error:
         return ReliabilityAssessment(UNKNOWN, f"Fetch error: {result.error}")
 
-    age_seconds = time.time() - result.fetched_at
+    global _last_assessed, _last_refresh_requested
+    age_seconds = now_fn() - result.fetched_at
+    if poller is not None and age_seconds > 45 and result is not _last_refresh_requested:
+        _last_refresh_requested = result
+        poller.trigger_refresh()
     if age_seconds > 120:
         return ReliabilityAssessment(BAD, f"Data is stale ({int(age_seconds)}s old)")
+
+    # Render loops pass the same PollResult every frame until the next poll,
+    # so the data-derived part is cached against the last result seen. The
+    # pair is swapped as one reference so concurrent callers stay consistent.
+    cached_result, assessment = _last_assessed
+    if result is not cached_result:
+        assessment = _assess_predictions(result)
+        _last_assessed = (result, assessment)
+
     if age_seconds > 45:
+        if poller is not None and assessment.classification == GOOD:
+            return ReliabilityAssessment(
+                GOOD, f"{assessment.reason} (revalidating, {int(age_seconds)}s old)"
+            )
         return ReliabilityAssessment(RISKY, f"Data is aging ({int(age_seconds)}s old)")
 
-    for prediction in result.predictions:
-        attributes = prediction.get("attributes", {})
-        if attributes.get("schedule_relationship") != "CANCELLED":
-            return assess_reliability(prediction, result.vehicles)
-
-    return ReliabilityAssessment(UNKNOWN, "No active predictions")
+    return assessment
 
 
 __all__ = [
@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
 
 from PIL import Image, ImageDraw, ImageFont
@@ -35,8 +37,11 @@ DOT_DIAMETER = 6
 DOT_RADIUS = DOT_DIAMETER // 2
 DOT_LEFT_MARGIN = 5
 DOT_CENTER_OFFSET = DOT_LEFT_MARGIN + DOT_RADIUS
+DOT_DIAMETER_LARGE = 8
 
 TEXT_LEFT_X = 14
+TEXT_LEFT_X_LARGE = 18
+LARGE_CELL_MIN_HEIGHT = 40
 TEXT_GAP = 3
 
 COLOR_TEXT = (255, 255, 255)
@@ -75,96 +80,225 @@ FONT_STATION = ImageFont.truetype(str(FONT_BOLD), 10)
 FONT_MINUTES_LARGE = ImageFont.truetype(str(FONT_BOLD), 18)
 FONT_CLOCK_LARGE = ImageFont.truetype(str(FONT_REGULAR), 11)
 
+PLACEHOLDER_TEXT = "--"
+STATIONS = [
+    (STATION_SULLIVAN, "12m"),
+    (STATION_UNION, "18m"),
+    (STATION_HARVARD, "28m"),
+]
 
-def _dot_color(reliability: str, trend: str) -> tuple[int, int, int]:
-    if reliability == GOOD:
-        return COLOR_GOOD
-    if reliability == RISKY:
-        return COLOR_RISKY_DETERIORATING if trend == "deteriorating" else COLOR_RISKY
-    if reliability == BAD:
-        return COLOR_BAD
-    if reliability == UNKNOWN:
-        return COLOR_UNKNOWN
-    return COLOR_UNKNOWN
-
-
-def _draw_trip_cell(
-    draw: ImageDraw.ImageDraw,
-    index: int,
-    trip: TripRow | None,
-    grid_cols: int,
-    cell_width: int,
-    cell_height: int,
+
+@lru_cache(maxsize=512)
+def _measure(text: str, font: ImageFont.FreeTypeFont) -> tuple[int, int]:
+    """Return (width, height) of text's ink bbox; fonts are module constants."""
+    # font.getbbox matches ImageDraw.textbbox for RGB frames, so measuring
+    # needs no draw context.
+    bbox = font.getbbox(text)
+    return bbox[2] - bbox[0], bbox[3] - bbox[1]
+
+
+def _text_height(text: str, font: ImageFont.FreeTypeFont) -> int:
+    return _measure(text, font)[1]
+
+
+@lru_cache(maxsize=512)
+def _text_stamp(text: str, font: ImageFont.FreeTypeFont) -> tuple[Image.Image, tuple[int, int]]:
+    """Rasterize text once into an L mask plus its offset from the draw origin."""
+    left, top, right, bottom = font.getbbox(text)
+    mask = Image.new("L", (right - left, bottom - top), 0)
+    ImageDraw.Draw(mask).text((-left, -top), text, font=font, fill=255)
+    return mask, (left, top)
+
+
+def _paste_text(
+    image: Image.Image,
+    xy: tuple[int, int],
+    text: str,
+    font: ImageFont.FreeTypeFont,
+    color: tuple[int, int, int],
 ) -> None:
-    col = index % grid_cols
-    row = index // grid_cols
-    cell_left = col * cell_width
-    cell_top = row * cell_height
-
-    large_mode = cell_height >= 40
-    dot_diameter = 8 if large_mode else DOT_DIAMETER
-    dot_top = cell_top + (cell_height - dot_diameter) // 2
-    dot_left = cell_left + DOT_LEFT_MARGIN
-    dot_right = dot_left + dot_diameter - 1
-    dot_bottom = dot_top + dot_diameter - 1
-    text_left_x = 18 if large_mode else TEXT_LEFT_X
+    # Pasting a solid colour through the cached mask matches draw.text exactly.
+    mask, (left, top) = _text_stamp(text, font)
+    image.paste(color, (xy[0] + left, xy[1] + top), mask)
+
+
+# Labels that never change are measured once at import.
+_STATION_LABEL_Y = {
+    label: STATION_STRIP_TOP + (STATION_STRIP_HEIGHT - _text_height(label, FONT_STATION)) // 2
+    for _, label in STATIONS
+}
+
+# Cell text is centred on one height per font (its digit height), so every
+# string drawn in a font shares a baseline regardless of its own ink extent.
+_FONT_HEIGHTS = {
+    font: _text_height("0123456789", font)
+    for font in (FONT_MINUTES, FONT_CLOCK, FONT_CANCELLED, FONT_MINUTES_LARGE, FONT_CLOCK_LARGE)
+}
+
+# Minutes labels recur every frame; measure and rasterize the common range at
+# import so the first frames do not pay for FreeType rendering.
+_WARM_LABELS = [
+    (text, font)
+    for font in (FONT_MINUTES, FONT_MINUTES_LARGE)
+    for text in ("NOW", *(f"{n}m" for n in range(1, 61)))
+]
+_WARM_LABELS += [(PLACEHOLDER_TEXT, FONT_CANCELLED), ("CNCLD", FONT_CANCELLED)]
+for _text, _font in _WARM_LABELS:
+    _measure(_text, _font)
+    _text_stamp(_text, _font)
+del _text, _font
+
+
+def _dot_mask(diameter: int) -> Image.Image:
+    mask = Image.new("L", (diameter, diameter), 0)
+    ImageDraw.Draw(mask).ellipse((0, 0, diameter - 1, diameter - 1), fill=255)
+    return mask
+
+
+# Dots are stamped through pre-rasterized masks rather than drawn per frame.
+_DOT_MASKS = {diameter: _dot_mask(diameter) for diameter in (DOT_DIAMETER, DOT_DIAMETER_LARGE)}
+
+
+_DOT_COLORS = {
+    GOOD: COLOR_GOOD,
+    RISKY: COLOR_RISKY,
+    BAD: COLOR_BAD,
+    UNKNOWN: COLOR_UNKNOWN,
+}
+_DETERIORATING_DOT_COLORS = {**_DOT_COLORS, RISKY: COLOR_RISKY_DETERIORATING}
+
+
+def _dot_color(reliability: str, trend: str) -> tuple[int, int, int]:
+    colors = _DETERIORATING_DOT_COLORS if trend == "deteriorating" else _DOT_COLORS
+    return colors.get(reliability, COLOR_UNKNOWN)
+
+
+@dataclass(frozen=True, slots=True)
+class _CellGeometry:
+    """Precomputed placement of one trip cell within a layout."""
+
+    text_x: int
+    minutes_y: int
+    clock_y: int
+    cancelled_y: int
+    dot_origin: tuple[int, int]
+    dot_diameter: int
+    minutes_font: ImageFont.FreeTypeFont
+    clock_font: ImageFont.FreeTypeFont
+
+
+def _cell_geometry(grid_cols: int, grid_rows: int, cell_width: int, cell_height: int) -> tuple[_CellGeometry, ...]:
+    large_mode = cell_height >= LARGE_CELL_MIN_HEIGHT
+    dot_diameter = DOT_DIAMETER_LARGE if large_mode else DOT_DIAMETER
+    text_left_x = TEXT_LEFT_X_LARGE if large_mode else TEXT_LEFT_X
     minutes_font = FONT_MINUTES_LARGE if large_mode else FONT_MINUTES
     clock_font = FONT_CLOCK_LARGE if large_mode else FONT_CLOCK
+    cells = []
+    for index in range(grid_cols * grid_rows):
+        cell_left = (index % grid_cols) * cell_width
+        cell_top = (index // grid_cols) * cell_height
+        dot_top = cell_top + (cell_height - dot_diameter) // 2
+        dot_left = cell_left + DOT_LEFT_MARGIN
+        cells.append(
+            _CellGeometry(
+                text_x=cell_left + text_left_x,
+                minutes_y=cell_top + (cell_height - _FONT_HEIGHTS[minutes_font]) // 2,
+                clock_y=cell_top + (cell_height - _FONT_HEIGHTS[clock_font]) // 2,
+                cancelled_y=cell_top + (cell_height - _FONT_HEIGHTS[FONT_CANCELLED]) // 2,
+                dot_origin=(dot_left, dot_top),
+                dot_diameter=dot_diameter,
+                minutes_font=minutes_font,
+                clock_font=clock_font,
+            )
+        )
+    return tuple(cells)
+
+
+def _draw_trip_cell(image: Image.Image, cell: _CellGeometry, trip: TripRow | None) -> None:
+    text_x = cell.text_x
+    strike_color = None
 
     if trip is None:
         dot_color = COLOR_PLACEHOLDER_DOT
-        text = "--"
-        text_color = COLOR_DIM_TEXT
-        text_font = FONT_CANCELLED
-        bbox = draw.textbbox((0, 0), text, font=text_font)
-        text_height = bbox[3] - bbox[1]
-        text_y = cell_top + (cell_height - text_height) // 2
-        draw.ellipse([dot_left, dot_top, dot_right, dot_bottom], fill=dot_color)
-        draw.text((cell_left + text_left_x, text_y), text, font=text_font, fill=text_color)
-        return
-
-    if trip.cancelled:
+        runs = ((PLACEHOLDER_TEXT, FONT_CANCELLED, COLOR_DIM_TEXT, text_x, cell.cancelled_y),)
+    elif trip.cancelled:
         dot_color = COLOR_UNKNOWN
-        text = trip.clock_time or "CNCLD"
-        text_color = COLOR_DIM_TEXT
-        bbox = draw.textbbox((0, 0), text, font=FONT_CANCELLED)
-        text_width = bbox[2] - bbox[0]
-        text_height = bbox[3] - bbox[1]
-        text_x = cell_left + text_left_x
-        text_y = cell_top + (cell_height - text_height) // 2
-        draw.ellipse([dot_left, dot_top, dot_right, dot_bottom], fill=dot_color)
-        draw.text((text_x, text_y), text, font=FONT_CANCELLED, fill=text_color)
-        strike_y = text_y + text_height // 2
-        draw.line(
-            (text_x, strike_y, text_x + text_width, strike_y),
-            fill=text_color,
-            width=1,
+        strike_color = COLOR_DIM_TEXT
+        runs = ((trip.clock_time or "CNCLD", FONT_CANCELLED, COLOR_DIM_TEXT, text_x, cell.cancelled_y),)
+    else:
+        minutes_text = "NOW" if trip.minutes_away < 1.0 else f"{round(trip.minutes_away)}m"
+        clock_x = text_x + _measure(minutes_text, cell.minutes_font)[0] + TEXT_GAP
+        if trip.departed:
+            dot_color = COLOR_GOOD
+            minutes_color = COLOR_GOOD
+            clock_color = COLOR_CLOCK_COMMITTED
+        else:
+            dot_color = _dot_color(trip.reliability, trip.trend)
+            minutes_color = COLOR_TEXT
+            clock_color = COLOR_CLOCK
+        runs = (
+            (minutes_text, cell.minutes_font, minutes_color, text_x, cell.minutes_y),
+            (trip.clock_time, cell.clock_font, clock_color, clock_x, cell.clock_y),
         )
-        return
 
-    dot_color = COLOR_GOOD if trip.departed else _dot_color(trip.reliability, trip.trend)
-    minutes_text = "NOW" if trip.minutes_away < 1.0 else f"{round(trip.minutes_away)}m"
-    minutes_bbox = draw.textbbox((0, 0), minutes_text, font=minutes_font)
-    minutes_width = minutes_bbox[2] - minutes_bbox[0]
-    minutes_height = minutes_bbox[3] - minutes_bbox[1]
-    minutes_y = cell_top + (cell_height - minutes_height) // 2
-    minutes_x = cell_left + text_left_x
-    minutes_color = COLOR_GOOD if trip.departed else COLOR_TEXT
+    image.paste(dot_color, cell.dot_origin, _DOT_MASKS[cell.dot_diameter])
+    for text, font, color, x, y in runs:
+        _paste_text(image, (x, y), text, font, color)
+        if strike_color is not None:
+            strike_y = y + _FONT_HEIGHTS[font] // 2
+            strike_right = x + _measure(text, font)[0]
+            image.paste(strike_color, (x, strike_y, strike_right + 1, strike_y + 1))
 
-    clock_text = trip.clock_time
-    clock_bbox = draw.textbbox((0, 0), clock_text, font=clock_font)
-    clock_height = clock_bbox[3] - clock_bbox[1]
-    clock_x = minutes_x + minutes_width + TEXT_GAP
-    clock_y = cell_top + (cell_height - clock_height) // 2
-    clock_color = COLOR_CLOCK_COMMITTED if trip.departed else COLOR_CLOCK
 
-    draw.ellipse([dot_left, dot_top, dot_right, dot_bottom], fill=dot_color)
-    draw.text((minutes_x, minutes_y), minutes_text, font=minutes_font, fill=minutes_color)
-    draw.text((clock_x, clock_y), clock_text, font=clock_font, fill=clock_color)
+def _background(width: int, height: int) -> Image.Image:
+    """Render the static station strip for a layout."""
+    image = Image.new("RGB", (width, height), (0, 0, 0))
+    draw = ImageDraw.Draw(image)
 
+    if height == DISPLAY_HEIGHT:
+        station_blocks = STATIONS[: width // PANEL_WIDTH]
+        for idx, (color, label) in enumerate(station_blocks):
+            block_left = idx * PANEL_WIDTH
+            bar_right = block_left + STATION_BAR_WIDTH - 1
+            draw.rectangle(
+                (block_left, STATION_STRIP_TOP, bar_right, height - 1),
+                fill=color,
+            )
 
-def compose_frame(data: FrameData, width: int = DISPLAY_WIDTH, height: int = DISPLAY_HEIGHT) -> Image.Image:
-    """Compose an RGB frame from FrameData for 32px or 64px tall panel chains."""
+            text_y = _STATION_LABEL_Y[label]
+            text_x = block_left + STATION_BAR_WIDTH + 2
+            draw.text((text_x, text_y), label, font=FONT_STATION, fill=color)
+
+    return image
+
+
+def _grid_lines(
+    width: int, grid_rows: int, trip_zone_height: int
+) -> tuple[tuple[tuple[int, int, int], tuple[int, int, int, int]], ...]:
+    """Return (color, box) for each grid and separator line of a layout."""
+    lines = [
+        (GRID_LINE_COLOR, (x, 0, x + 1, trip_zone_height))
+        for x in range(PANEL_WIDTH, width, PANEL_WIDTH)
+    ]
+    if grid_rows == 2:
+        lines.append((GRID_LINE_COLOR, (0, GRID_HORIZONTAL, width, GRID_HORIZONTAL + 1)))
+        lines.append((SEPARATOR_COLOR, (0, SEPARATOR_Y, width, SEPARATOR_Y + 1)))
+    return tuple(lines)
+
+
+@dataclass(frozen=True, slots=True)
+class _Layout:
+    """Everything about a frame that depends only on the display geometry."""
+
+    background: Image.Image
+    cells: tuple[_CellGeometry, ...]
+    # Drawn after the cells so long text never paints over a grid line.
+    grid_lines: tuple[tuple[tuple[int, int, int], tuple[int, int, int, int]], ...]
+
+
+@lru_cache(maxsize=4)
+def _layout(width: int, height: int) -> _Layout:
+    """Resolve a display size to its background and cell table, once per size."""
     if width % PANEL_WIDTH != 0:
         raise ValueError(f"Width must be a multiple of {PANEL_WIDTH}, got {width}.")
     if height not in (DISPLAY_HEIGHT_SMALL, DISPLAY_HEIGHT):
@@ -181,42 +315,38 @@ def compose_frame(data: FrameData, width: int = DISPLAY_WIDTH, height: int = DIS
         grid_rows = 2 if height == DISPLAY_HEIGHT else 1
         cell_height = 24 if grid_rows == 2 else height
     trip_zone_height = grid_rows * cell_height
-    image = Image.new("RGB", (width, height), (0, 0, 0))
-    draw = ImageDraw.Draw(image)
+    return _Layout(
+        background=_background(width, height),
+        cells=_cell_geometry(grid_cols, grid_rows, PANEL_WIDTH, cell_height),
+        grid_lines=_grid_lines(width, grid_rows, trip_zone_height),
+    )
 
-    trips = list(data.trips)[: grid_cols * grid_rows]
-    for idx in range(grid_cols * grid_rows):
-        trip = trips[idx] if idx < len(trips) else None
-        _draw_trip_cell(draw, idx, trip, grid_cols, PANEL_WIDTH, cell_height)
 
-    for x in range(PANEL_WIDTH, width, PANEL_WIDTH):
-        draw.line((x, 0, x, trip_zone_height - 1), fill=GRID_LINE_COLOR)
-    if grid_rows == 2:
-        draw.line((0, GRID_HORIZONTAL, width - 1, GRID_HORIZONTAL), fill=GRID_LINE_COLOR)
-        draw.line((0, SEPARATOR_Y, width - 1, SEPARATOR_Y), fill=SEPARATOR_COLOR)
-
-    stations = [
-        (STATION_SULLIVAN, "12m"),
-        (STATION_UNION, "18m"),
-        (STATION_HARVARD, "28m"),
-    ]
-    if height == DISPLAY_HEIGHT:
-        station_blocks = stations[:grid_cols]
-        for idx, (color, label) in enumerate(station_blocks):
-            block_left = idx * PANEL_WIDTH
-            bar_right = block_left + STATION_BAR_WIDTH - 1
-            draw.rectangle(
-                (block_left, STATION_STRIP_TOP, bar_right, height - 1),
-                fill=color,
-            )
+# One-slot memo of the last composed frame; the display refreshes far more
+# often than the trip data changes.
+_last_frame: tuple[tuple | None, Image.Image | None] = (None, None)
 
-            text_bbox = draw.textbbox((0, 0), label, font=FONT_STATION)
-            text_height = text_bbox[3] - text_bbox[1]
-            text_y = STATION_STRIP_TOP + (STATION_STRIP_HEIGHT - text_height) // 2
-            text_x = block_left + STATION_BAR_WIDTH + 2
-            draw.text((text_x, text_y), label, font=FONT_STATION, fill=color)
 
-    return image
+def compose_frame(data: FrameData, width: int = DISPLAY_WIDTH, height: int = DISPLAY_HEIGHT) -> Image.Image:
+    """Compose an RGB frame from FrameData for 32px or 64px tall panel chains."""
+    global _last_frame
+    key = (tuple(data.trips), width, height)
+    cached_key, cached_image = _last_frame
+    if cached_image is not None and key == cached_key:
+        return cached_image.copy()
+
+    layout = _layout(width, height)
+    image = layout.background.copy()
+    trips = data.trips
+    trip_count = len(trips)
+    for idx, cell in enumerate(layout.cells):
+        trip = trips[idx] if idx < trip_count else None
+        _draw_trip_cell(image, cell, trip)
+    for color, box in layout.grid_lines:
+        image.paste(color, box)
+
+    _last_frame = (key, image)
+    return image.copy()
 
 
 __all__ = ["compose_frame"]
@@ -5,7 +5,7 @@ from __future__ import annotations
 from dataclasses import dataclass
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class TripRow:
     """Single trip cell for display."""
 
@@ -18,7 +18,7 @@ class TripRow:
     trend: str = "stable"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class FrameData:
     """Frame data for the renderer."""
 
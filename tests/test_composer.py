@@ -1,8 +1,10 @@
 from __future__ import annotations
 
+import pytest
 from PIL import Image, ImageChops
 
 from src.logic.scorer import BAD, GOOD, RISKY, UNKNOWN
+from src.rendering import composer
 from src.rendering.composer import (
     COLOR_BAD,
     COLOR_GOOD,
@@ -12,6 +14,7 @@ from src.rendering.composer import (
     CELL_HEIGHT,
     CELL_WIDTH,
     DOT_CENTER_OFFSET,
+    GRID_LINE_COLOR,
     STATION_HARVARD,
     STATION_SULLIVAN,
     STATION_UNION,
@@ -58,7 +61,7 @@ def test_compose_frame_six_trips_dot_colors() -> None:
         ],
         ticker_text="All good",
     )
-    image = compose_frame(data)
+    image = compose_frame(data, width=192, height=64)
     pixels = image.load()
 
     assert pixels[_dot_center(0)] == COLOR_GOOD
@@ -79,7 +82,7 @@ def test_compose_frame_partial_grid_placeholder_cells() -> None:
         ],
         ticker_text="",
     )
-    image = compose_frame(data)
+    image = compose_frame(data, width=192, height=64)
     pixels = image.load()
 
     assert pixels[_dot_center(4)] == COLOR_PLACEHOLDER_DOT
@@ -88,7 +91,7 @@ def test_compose_frame_partial_grid_placeholder_cells() -> None:
 
 def test_compose_frame_zero_trips_placeholder_rows() -> None:
     data = FrameData(trips=[], ticker_text="")
-    image = compose_frame(data)
+    image = compose_frame(data, width=192, height=64)
     pixels = image.load()
 
     assert pixels[_dot_center(0)] == COLOR_PLACEHOLDER_DOT
@@ -108,7 +111,7 @@ def test_compose_frame_reliability_colors() -> None:
         ],
         ticker_text="",
     )
-    image = compose_frame(data)
+    image = compose_frame(data, width=192, height=64)
     pixels = image.load()
 
     assert pixels[_dot_center(0)] == COLOR_GOOD
@@ -118,13 +121,13 @@ def test_compose_frame_reliability_colors() -> None:
 
 def test_compose_frame_ticker_smoke() -> None:
     data = FrameData(trips=[TripRow(1, "12:00", GOOD)], ticker_text="Service normal")
-    image = compose_frame(data)
+    image = compose_frame(data, width=192, height=64)
     assert image.size == (192, 64)
 
 
 def test_station_strip_colors() -> None:
     data = FrameData(trips=[], ticker_text="")
-    image = compose_frame(data)
+    image = compose_frame(data, width=192, height=64)
     pixels = image.load()
 
     y = 56
@@ -138,26 +141,26 @@ def test_cancelled_trip_smoke() -> None:
         trips=[TripRow(0, "1:45", UNKNOWN, cancelled=True)],
         ticker_text="",
     )
-    image = compose_frame(data)
+    image = compose_frame(data, width=192, height=64)
     assert image.size == (192, 64)
 
 
 def test_minutes_now_thresholds() -> None:
     data_now = FrameData(trips=[TripRow(0.9, "12:00", GOOD)], ticker_text="")
-    image_now = compose_frame(data_now)
+    image_now = compose_frame(data_now, width=192, height=64)
     data_now_low = FrameData(trips=[TripRow(0.4, "12:00", GOOD)], ticker_text="")
-    image_now_low = compose_frame(data_now_low)
+    image_now_low = compose_frame(data_now_low, width=192, height=64)
     data_one = FrameData(trips=[TripRow(1.1, "12:00", GOOD)], ticker_text="")
-    image_one = compose_frame(data_one)
+    image_one = compose_frame(data_one, width=192, height=64)
     assert ImageChops.difference(image_now, image_now_low).getbbox() is None
     assert ImageChops.difference(image_now, image_one).getbbox() is not None
 
 
 def test_minutes_rounding_thresholds() -> None:
     data_one = FrameData(trips=[TripRow(1.4, "12:00", GOOD)], ticker_text="")
-    image_one = compose_frame(data_one)
+    image_one = compose_frame(data_one, width=192, height=64)
     data_two = FrameData(trips=[TripRow(1.6, "12:00", GOOD)], ticker_text="")
-    image_two = compose_frame(data_two)
+    image_two = compose_frame(data_two, width=192, height=64)
     assert ImageChops.difference(image_one, image_two).getbbox() is not None
 
 
@@ -197,3 +200,38 @@ def test_compose_frame_32px_layout() -> None:
     assert image.size == (128, 32)
     assert pixels[DOT_CENTER_OFFSET, 16] == COLOR_GOOD
     assert pixels[64 + DOT_CENTER_OFFSET, 16] == COLOR_RISKY
+
+
+def test_compose_frame_reuses_unchanged_frame(monkeypatch: pytest.MonkeyPatch) -> None:
+    calls = []
+    real_draw = composer._draw_trip_cell
+
+    def counting_draw(image, cell, trip) -> None:
+        calls.append(trip)
+        real_draw(image, cell, trip)
+
+    monkeypatch.setattr(composer, "_draw_trip_cell", counting_draw)
+    monkeypatch.setattr(composer, "_last_frame", (None, None))
+    data = FrameData(trips=[TripRow(3, "12:01", GOOD)], ticker_text="")
+    first = compose_frame(data, width=192, height=64)
+    assert len(calls) == 6
+
+    first.putpixel((0, 0), (1, 2, 3))
+    same = FrameData(trips=[TripRow(3, "12:01", GOOD)], ticker_text="")
+    second = compose_frame(same, width=192, height=64)
+    assert len(calls) == 6
+    assert second is not first
+    assert second.getpixel((0, 0)) == (0, 0, 0)
+
+    other = FrameData(trips=[TripRow(3, "12:01", BAD)], ticker_text="")
+    changed = compose_frame(other, width=192, height=64)
+    assert len(calls) == 12
+    assert ImageChops.difference(second, changed).getbbox() is not None
+
+
+def test_grid_line_drawn_over_overflowing_text() -> None:
+    data = FrameData(trips=[TripRow(120, "12:34", GOOD)], ticker_text="")
+    image = compose_frame(data, width=128, height=64)
+    pixels = image.load()
+
+    assert all(pixels[64, y] == GRID_LINE_COLOR for y in range(48))
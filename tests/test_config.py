@@ -1,10 +1,11 @@
 from __future__ import annotations
 
+import os
 import textwrap
 
 import pytest
 
-from src.config import AppConfig, load_config
+from src.config import AppConfig, load_config, load_env
 
 
 VALID_YAML = """
@@ -91,3 +92,33 @@ def test_load_config_missing_stop_id(tmp_path) -> None:
 
     with pytest.raises(ValueError):
         load_config(path)
+
+
+def test_load_env_sets_missing_variables(tmp_path, monkeypatch) -> None:
+    env_path = tmp_path / ".env"
+    env_path.write_text(
+        textwrap.dedent(
+            """
+            # comment
+            MBTA_API_KEY="quoted-key"
+            export OTHER_VAR = plain
+            EXISTING=from-file
+            not a pair
+            """
+        )
+    )
+    # setenv first so monkeypatch restores whatever load_env writes.
+    for name in ("MBTA_API_KEY", "OTHER_VAR"):
+        monkeypatch.setenv(name, "")
+        monkeypatch.delenv(name)
+    monkeypatch.setenv("EXISTING", "from-env")
+
+    load_env(str(env_path))
+
+    assert os.environ["MBTA_API_KEY"] == "quoted-key"
+    assert os.environ["OTHER_VAR"] == "plain"
+    assert os.environ["EXISTING"] == "from-env"
+
+
+def test_load_env_missing_file_is_ignored(tmp_path) -> None:
+    load_env(str(tmp_path / "missing.env"))
@@ -0,0 +1,55 @@
+from __future__ import annotations
+
+import gzip
+from pathlib import Path
+
+from src.data.log_files import iter_jsonl
+
+
+def test_iter_jsonl_reads_plain_and_skips_bad_lines(tmp_path: Path) -> None:
+    path = tmp_path / "predictions.jsonl"
+    path.write_text('{"n": 1}\n\nnot json\n{"n": 2}\n{"n": 3', encoding="utf-8")
+
+    assert list(iter_jsonl(path)) == [{"n": 1}, {"n": 2}]
+
+
+def test_iter_jsonl_stops_cleanly_on_truncated_gzip(tmp_path: Path) -> None:
+    path = tmp_path / "predictions.jsonl.gz"
+    with gzip.open(path, "ab") as handle:
+        handle.write(b'{"n": 1}\n')
+    # A second writer that syncs but never closes leaves a member without a
+    # trailer, as a crash mid-append would.
+    handle = gzip.open(path, "ab")
+    handle.write(b'{"n": 2}\n')
+    handle.flush()
+    truncated = path.read_bytes()
+    handle.close()
+    path.write_bytes(truncated)
+
+    assert list(iter_jsonl(path)) == [{"n": 1}, {"n": 2}]
+
+
+def test_iter_jsonl_resumes_after_crash_and_restart(tmp_path: Path) -> None:
+    path = tmp_path / "predictions.jsonl.gz"
+    with gzip.open(path, "ab") as handle:
+        handle.write(b'{"n": 1}\n')
+    # The crashed process leaves a flushed member with no trailer...
+    crashed = gzip.open(path, "ab")
+    crashed.write(b'{"n": 2}\n')
+    crashed.flush()
+    truncated = path.read_bytes()
+    crashed.close()
+    path.write_bytes(truncated)
+    # ...and the restarted one appends fresh members after it.
+    for n in (3, 4):
+        with gzip.open(path, "ab") as handle:
+            handle.write(b'{"n": %d}\n' % n)
+
+    assert list(iter_jsonl(path)) == [{"n": 1}, {"n": 2}, {"n": 3}, {"n": 4}]
+
+
+def test_iter_jsonl_empty_gzip_file(tmp_path: Path) -> None:
+    path = tmp_path / "errors.jsonl.gz"
+    path.touch()
+
+    assert list(iter_jsonl(path)) == []
@@ -1,7 +1,8 @@
 from __future__ import annotations
 
+import sys
 from typing import Any
-from unittest.mock import Mock, patch
+from unittest.mock import Mock
 
 import pytest
 import requests
@@ -9,11 +10,6 @@ import requests
 from src.data.mbta_client import MBTAClient, MBTAClientError
 
 
-@pytest.fixture()
-def mbta_client() -> MBTAClient:
-    return MBTAClient("test-key")
-
-
 def _mock_response(status_code: int, json_data: dict[str, Any] | None = None, text: str = "") -> Mock:
     response = Mock()
     response.status_code = status_code
@@ -25,52 +21,127 @@ def _mock_response(status_code: int, json_data: dict[str, Any] | None = None, te
     return response
 
 
-def test_get_predictions_returns_data_and_vehicles(mbta_client: MBTAClient) -> None:
-    response = _mock_response(200, {"data": [{"id": "p1"}], "included": [{"id": "v1"}]})
-    with patch("requests.get", return_value=response) as mock_get:
-        predictions, vehicles = mbta_client.get_predictions("109", "stop1", 1)
+# Canned responses are only read by the client, so they are built once and
+# shared; tests that need unique payloads still build their own.
+_PREDICTIONS_RESPONSE = _mock_response(200, {"data": [{"id": "p1"}], "included": [{"id": "v1"}]})
+_PREDICTIONS_NO_INCLUDED_RESPONSE = _mock_response(200, {"data": [{"id": "p1"}]})
+_VEHICLES_RESPONSE = _mock_response(200, {"data": [{"id": "v1"}]})
+_NOT_FOUND_RESPONSE = _mock_response(404, {"error": "Not found"}, text="Not found")
+_INVALID_JSON_RESPONSE = _mock_response(200, None)
+
+
+class _FakeSession:
+    """Per-test stand-in for requests.Session that returns or raises a canned result."""
+
+    def __init__(self, response: Mock | None = None, error: Exception | None = None) -> None:
+        self.headers: dict[str, str] = {}
+        self.calls: list[tuple[str, dict[str, Any]]] = []
+        self._response = response
+        self._error = error
+        self.closed = False
+
+    def get(self, url: str, **kwargs: Any) -> Mock | None:
+        self.calls.append((url, kwargs))
+        if self._error is not None:
+            raise self._error
+        return self._response
+
+    def close(self) -> None:
+        self.closed = True
+
+
+def _client(
+    response: Mock | None = None, error: Exception | None = None
+) -> tuple[MBTAClient, _FakeSession]:
+    session = _FakeSession(response, error)
+    return MBTAClient("test-key", session=session), session
+
+
+def test_api_key_sent_per_request_without_touching_injected_session() -> None:
+    client, session = _client(_VEHICLES_RESPONSE)
+    client.get_vehicles("109")
+
+    assert session.headers == {}
+    url, kwargs = session.calls[0]
+    assert url.endswith("/vehicles")
+    assert kwargs["params"] == {"filter[route]": "109"}
+    assert kwargs["headers"] == {"x-api-key": "test-key"}
 
-    assert predictions == [{"id": "p1"}]
-    assert vehicles == [{"id": "v1"}]
-    mock_get.assert_called_once()
 
+def test_close_leaves_injected_session_open() -> None:
+    client, session = _client(_VEHICLES_RESPONSE)
+    client.close()
 
-def test_get_predictions_empty_included(mbta_client: MBTAClient) -> None:
-    response = _mock_response(200, {"data": [{"id": "p1"}]})
-    with patch("requests.get", return_value=response) as mock_get:
-        predictions, vehicles = mbta_client.get_predictions("109", "stop1", 1)
+    assert not session.closed
+
+
+def test_close_closes_owned_session(monkeypatch: pytest.MonkeyPatch) -> None:
+    session = _FakeSession()
+    monkeypatch.setattr(requests, "Session", lambda: session)
+    client = MBTAClient("test-key")
+    client.close()
+
+    assert session.closed
+
+
+def test_get_predictions_returns_data_and_vehicles() -> None:
+    client, session = _client(_PREDICTIONS_RESPONSE)
+    predictions, vehicles = client.get_predictions("109", "stop1", 1)
 
     assert predictions == [{"id": "p1"}]
-    assert vehicles == []
-    mock_get.assert_called_once()
+    assert vehicles == [{"id": "v1"}]
+    assert len(session.calls) == 1
 
 
-def test_get_vehicles_returns_data(mbta_client: MBTAClient) -> None:
-    response = _mock_response(200, {"data": [{"id": "v1"}]})
-    with patch("requests.get", return_value=response) as mock_get:
-        vehicles = mbta_client.get_vehicles("109")
+def test_get_predictions_drops_non_object_entries() -> None:
+    response = _mock_response(200, {"data": [{"id": "p1"}, None], "included": ["v1", {"id": "v1"}]})
+    client, _ = _client(response)
+    predictions, vehicles = client.get_predictions("109", "stop1", 1)
 
+    assert predictions == [{"id": "p1"}]
     assert vehicles == [{"id": "v1"}]
-    mock_get.assert_called_once()
 
 
-def test_non_200_raises_mbta_client_error(mbta_client: MBTAClient) -> None:
-    response = _mock_response(404, {"error": "Not found"}, text="Not found")
-    with patch("requests.get", return_value=response):
-        with pytest.raises(MBTAClientError) as exc_info:
-            mbta_client.get_vehicles("109")
+def test_get_predictions_empty_included() -> None:
+    client, session = _client(_PREDICTIONS_NO_INCLUDED_RESPONSE)
+    predictions, vehicles = client.get_predictions("109", "stop1", 1)
+
+    assert predictions == [{"id": "p1"}]
+    assert vehicles == []
+    assert len(session.calls) == 1
+
 
-    assert "404" in str(exc_info.value)
+def test_get_predictions_interns_schedule_relationship() -> None:
+    relationship = "".join(["CANCEL", "LED"])
+    response = _mock_response(
+        200, {"data": [{"id": "p1", "attributes": {"schedule_relationship": relationship}}]}
+    )
+    client, _ = _client(response)
+    predictions, _ = client.get_predictions("109", "stop1", 1)
 
+    assert predictions[0]["attributes"]["schedule_relationship"] is sys.intern("CANCELLED")
 
-def test_network_error_raises_mbta_client_error(mbta_client: MBTAClient) -> None:
-    with patch("requests.get", side_effect=requests.exceptions.ConnectionError("boom")):
-        with pytest.raises(MBTAClientError):
-            mbta_client.get_vehicles("109")
 
+def test_get_vehicles_returns_data() -> None:
+    client, session = _client(_VEHICLES_RESPONSE)
+    vehicles = client.get_vehicles("109")
 
-def test_invalid_json_raises_mbta_client_error(mbta_client: MBTAClient) -> None:
-    response = _mock_response(200, None)
-    with patch("requests.get", return_value=response):
-        with pytest.raises(MBTAClientError):
-            mbta_client.get_vehicles("109")
+    assert vehicles == [{"id": "v1"}]
+    assert len(session.calls) == 1
+
+
+@pytest.mark.parametrize(
+    ("stub", "expected_message"),
+    [
+        ({"response": _NOT_FOUND_RESPONSE}, "404"),
+        ({"error": requests.exceptions.ConnectionError("boom")}, "boom"),
+        ({"response": _INVALID_JSON_RESPONSE}, "not valid JSON"),
+    ],
+    ids=["non_200", "network_error", "invalid_json"],
+)
+def test_request_failures_raise_mbta_client_error(stub: dict[str, Any], expected_message: str) -> None:
+    client, _ = _client(**stub)
+    with pytest.raises(MBTAClientError) as exc_info:
+        client.get_vehicles("109")
+
+    assert expected_message in str(exc_info.value)
@@ -1,95 +1,266 @@
 from __future__ import annotations
 
+from datetime import datetime, timezone
+import threading
 import time
-from unittest.mock import MagicMock
+from typing import Any
 
 from src.data.mbta_client import MBTAClientError
-from src.data.poller import MBTAPoller, PollResult
+from src.data.poller import HISTORY_SIZE, MBTAPoller, PollResult
 
 
-def test_get_latest_initially_none() -> None:
-    client = MagicMock()
-    poller = MBTAPoller(
+class _FakeClient:
+    """Stand-in client that replays scripted responses, then returns no data.
+
+    Each scripted response is a (predictions, vehicles) pair or an exception
+    to raise.
+    """
+
+    def __init__(self, *responses: tuple[list, list] | Exception) -> None:
+        self.calls: list[tuple[str, str, int]] = []
+        self._responses = responses
+        self._called = threading.Condition()
+
+    def get_predictions(self, route_id: str, stop_id: str, direction_id: int) -> tuple[list, list]:
+        with self._called:
+            self.calls.append((route_id, stop_id, direction_id))
+            index = len(self.calls) - 1
+            self._called.notify_all()
+        response = self._responses[index] if index < len(self._responses) else ([], [])
+        if isinstance(response, Exception):
+            raise response
+        return response
+
+    def wait_for_calls(self, count: int, timeout: float = 2.0) -> bool:
+        with self._called:
+            return self._called.wait_for(lambda: len(self.calls) >= count, timeout)
+
+
+class _CountingWake:
+    """Wake event stand-in that skips each wait, records it, and stops after a count."""
+
+    def __init__(self, poller: MBTAPoller, waits: int) -> None:
+        self.timeouts: list[float] = []
+        self._poller = poller
+        self._waits = waits
+
+    def wait(self, timeout: float | None = None) -> bool:
+        self.timeouts.append(timeout)
+        if len(self.timeouts) >= self._waits:
+            self._poller.stop()
+        return True
+
+    def set(self) -> None:
+        pass
+
+    def clear(self) -> None:
+        pass
+
+
+def _poller(client: _FakeClient, poll_interval_seconds: int = 60, **kwargs: Any) -> MBTAPoller:
+    return MBTAPoller(
         client=client,
         route_id="109",
         stop_id="stop1",
         direction_id=1,
-        poll_interval_seconds=1,
+        poll_interval_seconds=poll_interval_seconds,
+        **kwargs,
     )
 
+
+def _run_polls(poller: MBTAPoller, polls: int) -> list[float]:
+    """Run the poll loop for a fixed number of polls; return the waits it chose."""
+    wake = _CountingWake(poller, polls)
+    poller._wake_event = wake
+    poller.start()
+    poller._thread.join(timeout=2.0)
+    assert not poller._thread.is_alive()
+    return wake.timeouts
+
+
+def test_get_latest_initially_none() -> None:
+    poller = _poller(_FakeClient())
+
     assert poller.get_latest() is None
+    assert poller.get_history() == []
 
 
-def test_fetch_once_success() -> None:
-    client = MagicMock()
-    client.get_predictions.return_value = ([{"id": "p1"}], [{"id": "v1"}])
-    poller = MBTAPoller(
-        client=client,
-        route_id="109",
-        stop_id="stop1",
-        direction_id=1,
-        poll_interval_seconds=1,
-    )
+def test_poll_publishes_fetched_result() -> None:
+    client = _FakeClient(([{"id": "p1"}], [{"id": "v1"}]))
+    published: list[PollResult] = []
+    poller = _poller(client, on_result=published.append)
 
-    result = poller._fetch_once()
+    _run_polls(poller, 1)
 
+    result = published[0]
     assert result.predictions == [{"id": "p1"}]
     assert result.vehicles == [{"id": "v1"}]
+    assert result.vehicles_by_id == {"v1": {"id": "v1"}}
     assert result.error is None
     assert isinstance(result.fetched_at, float)
     assert result.fetched_at > 0
-    client.get_predictions.assert_called_once_with("109", "stop1", 1)
+    assert poller.get_latest() is result
+    assert client.calls == [("109", "stop1", 1)]
 
 
-def test_fetch_once_client_error() -> None:
-    client = MagicMock()
-    client.get_predictions.side_effect = MBTAClientError("timeout")
-    poller = MBTAPoller(
-        client=client,
-        route_id="109",
-        stop_id="stop1",
-        direction_id=1,
-        poll_interval_seconds=1,
-    )
+def test_poll_reports_client_error() -> None:
+    client = _FakeClient(MBTAClientError("timeout"))
+    published: list[PollResult] = []
+    poller = _poller(client, on_result=published.append)
 
-    result = poller._fetch_once()
+    _run_polls(poller, 1)
 
+    result = published[0]
     assert result.predictions == []
     assert result.vehicles == []
     assert result.error == "timeout"
-    client.get_predictions.assert_called_once_with("109", "stop1", 1)
+    assert client.calls == [("109", "stop1", 1)]
 
 
-def test_start_and_stop() -> None:
-    client = MagicMock()
-    client.get_predictions.return_value = ([], [])
-    poller = MBTAPoller(
-        client=client,
-        route_id="109",
-        stop_id="stop1",
-        direction_id=1,
-        poll_interval_seconds=0.1,
+def test_poll_result_precomputes_prediction_columns() -> None:
+    result = PollResult(
+        predictions=[
+            {
+                "attributes": {"departure_time": "2024-01-01T12:00:00+00:00"},
+                "relationships": {"vehicle": {"data": {"id": "v1"}}},
+            },
+            {
+                "attributes": {"schedule_relationship": "CANCELLED"},
+                "relationships": {"vehicle": {"data": None}},
+            },
+        ],
+        vehicles=[
+            {"id": "v1", "attributes": {"updated_at": "2024-01-01T11:59:00+00:00"}},
+            {"id": "v2", "attributes": {}},
+        ],
+        fetched_at=0.0,
+        error=None,
     )
 
-    poller.start()
+    assert result.pred_vehicle_ids == ["v1", None]
+    assert result.pred_cancelled == [False, True]
+    assert result.pred_departure_ts == [1704110400.0, None]
+    assert result.vehicle_updated_ts == {"v1": 1704110340.0}
+
 
-    deadline = time.time() + 2
-    latest = None
-    while time.time() < deadline:
-        latest = poller.get_latest()
-        if latest is not None:
-            break
-        time.sleep(0.1)
+def test_poll_result_tolerates_malformed_payload() -> None:
+    result = PollResult(
+        predictions=[
+            {"attributes": None, "relationships": {"vehicle": None}},
+            {"relationships": None},
+        ],
+        vehicles=[
+            {"attributes": {"updated_at": "2024-01-01T11:59:00+00:00"}},
+            {"id": "v2", "attributes": None},
+        ],
+        fetched_at=0.0,
+        error=None,
+    )
 
-    assert isinstance(latest, PollResult)
+    assert result.vehicles_by_id == {"v2": {"id": "v2", "attributes": None}}
+    assert result.vehicle_updated_ts == {}
+    assert result.pred_vehicle_ids == [None, None]
+    assert result.pred_cancelled == [False, False]
 
-    poller.stop()
 
+def test_poll_loop_survives_unexpected_error() -> None:
+    client = _FakeClient(KeyError("id"), ([], []))
+    published: list[PollResult] = []
+    poller = _poller(client, on_result=published.append)
+
+    _run_polls(poller, 2)
+
+    assert "Unexpected error" in published[0].error
+    assert published[1].error is None
+
+
+def test_failing_on_result_does_not_stop_polling() -> None:
+    calls: list[PollResult] = []
+
+    def on_result(result: PollResult) -> None:
+        calls.append(result)
+        raise RuntimeError("callback failed")
+
+    poller = _poller(_FakeClient(), on_result=on_result)
+
+    _run_polls(poller, 2)
+
+    assert len(calls) == 2
+    assert poller.get_history() == [calls[1], calls[0]]
+
+
+def test_start_and_stop() -> None:
+    published: list[PollResult] = []
+    done = threading.Event()
+
+    def on_result(result: PollResult) -> None:
+        published.append(result)
+        done.set()
+
+    poller = _poller(_FakeClient(), on_result=on_result)
+
+    poller.start()
+    assert done.wait(timeout=2.0)
+    assert poller.get_latest() is published[0]
+
+    poller.stop()
     thread = poller._thread
     assert thread is not None
-
-    deadline = time.time() + 2
-    while time.time() < deadline and thread.is_alive():
-        time.sleep(0.05)
+    thread.join(timeout=2.0)
 
     assert not thread.is_alive()
+
+
+def test_trigger_refresh_wakes_poll_loop() -> None:
+    client = _FakeClient()
+    poller = _poller(client)
+
+    poller.start()
+    try:
+        assert client.wait_for_calls(1)
+        assert len(client.calls) == 1
+
+        poller.trigger_refresh()
+
+        assert client.wait_for_calls(2)
+    finally:
+        poller.stop()
+
+
+def _departing_in(minutes: float, now: float) -> dict:
+    departure = datetime.fromtimestamp(now + minutes * 60, tz=timezone.utc).isoformat()
+    return {"attributes": {"departure_time": departure}}
+
+
+def test_poll_interval_tracks_soonest_departure() -> None:
+    now = time.time()
+    client = _FakeClient(
+        *(
+            ([_departing_in(m, now) for m in minutes], [])
+            for minutes in ((), (45,), (45, 12), (7,), (30, 2))
+        )
+    )
+    poller = _poller(client, poll_interval_seconds=10)
+
+    assert _run_polls(poller, 5) == [10, 60, 30, 15, 5]
+
+
+def test_poll_interval_backs_off_on_error_and_resets() -> None:
+    client = _FakeClient(MBTAClientError("timeout"), MBTAClientError("timeout"), ([], []))
+    poller = _poller(client, poll_interval_seconds=40)
+
+    assert _run_polls(poller, 3) == [80, 120, 40]
+
+
+def test_get_history_newest_first_and_bounded() -> None:
+    published: list[PollResult] = []
+    poller = _poller(_FakeClient(), on_result=published.append)
+
+    _run_polls(poller, HISTORY_SIZE + 3)
+
+    latest, previous = poller.get_history(2)
+    assert latest is published[-1]
+    assert previous is published[-2]
+    history = poller.get_history()
+    assert len(history) == HISTORY_SIZE
+    assert history[-1] is published[3]
@@ -2,12 +2,16 @@ from __future__ import annotations
 
 import time
 
+import pytest
+
 from src.data.poller import PollResult
+from src.logic import scorer
 from src.logic.scorer import (
     BAD,
     GOOD,
     RISKY,
     UNKNOWN,
+    ReliabilityAssessment,
     assess_poll,
     assess_reliability,
     estimate_time_to_linden,
@@ -39,6 +43,13 @@ def _prediction(vehicle_id: str | None = None, schedule_relationship: str | None
     return {"relationships": relationships, "attributes": attributes}
 
 
+# The scorer treats its inputs as read-only, so shared fixtures are built once.
+_PREDICTION_NO_VEHICLE = _prediction()
+_PREDICTION_WITH_V1 = _prediction(vehicle_id="v1")
+_PREDICTION_CANCELLED = _prediction(schedule_relationship="CANCELLED")
+_VEHICLE_V1 = {"id": "v1", "attributes": {"updated_at": "2024-01-01T00:00:00Z"}}
+
+
 def test_assess_no_predictions_unknown() -> None:
     result = _poll_result(predictions=[], vehicles=[])
 
@@ -49,7 +60,7 @@ def test_assess_no_predictions_unknown() -> None:
 
 
 def test_assess_error_unknown() -> None:
-    result = _poll_result(predictions=[_prediction()], vehicles=[], error="timeout")
+    result = _poll_result(predictions=[_PREDICTION_NO_VEHICLE], vehicles=[], error="timeout")
 
     assessment = assess_poll(result)
 
@@ -58,47 +69,166 @@ def test_assess_error_unknown() -> None:
 
 
 def test_assess_stale_bad() -> None:
-    result = _poll_result(
-        predictions=[_prediction()],
-        vehicles=[],
-        fetched_at=time.time() - 300,
-    )
+    result = _poll_result(predictions=[_PREDICTION_NO_VEHICLE], vehicles=[], fetched_at=0.0)
 
-    assessment = assess_poll(result)
+    assessment = assess_poll(result, now_fn=lambda: 300.0)
 
     assert assessment.classification == BAD
     assert "stale" in assessment.reason
 
 
-def test_assess_missing_vehicle_risky() -> None:
-    prediction = _prediction(vehicle_id=None)
-    assessment = assess_reliability(prediction, [])
+def test_assess_aging_risky() -> None:
+    result = _poll_result(
+        predictions=[_PREDICTION_WITH_V1],
+        vehicles=[_VEHICLE_V1],
+        fetched_at=0.0,
+    )
+
+    assessment = assess_poll(result, now_fn=lambda: 60.0)
 
     assert assessment.classification == RISKY
-    assert "no assigned vehicle" in assessment.reason
+    assert "aging" in assessment.reason
+
+
+class _RefreshSpy:
+    """Stand-in poller that counts refresh requests."""
 
+    def __init__(self) -> None:
+        self.refreshes = 0
 
-def test_assess_assigned_vehicle_good() -> None:
-    prediction = _prediction(vehicle_id="v1")
-    assessment = assess_reliability(
-        prediction,
-        [{"id": "v1", "attributes": {"updated_at": "2024-01-01T00:00:00Z"}}],
+    def trigger_refresh(self) -> None:
+        self.refreshes += 1
+
+
+def test_assess_aging_good_revalidates() -> None:
+    poller = _RefreshSpy()
+    result = _poll_result(
+        predictions=[_PREDICTION_WITH_V1],
+        vehicles=[_VEHICLE_V1],
+        fetched_at=0.0,
     )
 
+    assessment = assess_poll(result, poller, now_fn=lambda: 60.0)
+
     assert assessment.classification == GOOD
-    assert "Vehicle assigned" in assessment.reason
+    assert "revalidating" in assessment.reason
+    assert poller.refreshes == 1
+
+
+def test_assess_aging_risky_with_poller_when_not_good() -> None:
+    poller = _RefreshSpy()
+    result = _poll_result(predictions=[_PREDICTION_NO_VEHICLE], vehicles=[], fetched_at=0.0)
+
+    assessment = assess_poll(result, poller, now_fn=lambda: 60.0)
+
+    assert assessment.classification == RISKY
+    assert "aging" in assessment.reason
+    assert poller.refreshes == 1
+
+
+def test_assess_stale_requests_refresh() -> None:
+    poller = _RefreshSpy()
+    result = _poll_result(predictions=[_PREDICTION_NO_VEHICLE], vehicles=[], fetched_at=0.0)
 
+    assessment = assess_poll(result, poller, now_fn=lambda: 300.0)
 
-def test_assess_poll_skips_cancelled() -> None:
+    assert assessment.classification == BAD
+    assert poller.refreshes == 1
+
+
+def test_assess_poll_requests_refresh_once_per_result() -> None:
+    poller = _RefreshSpy()
+    result = _poll_result(predictions=[_PREDICTION_WITH_V1], vehicles=[_VEHICLE_V1], fetched_at=0.0)
+
+    assess_poll(result, poller, now_fn=lambda: 60.0)
+    assess_poll(result, poller, now_fn=lambda: 61.0)
+    assert poller.refreshes == 1
+
+    newer = _poll_result(predictions=[_PREDICTION_WITH_V1], vehicles=[_VEHICLE_V1], fetched_at=0.0)
+    assess_poll(newer, poller, now_fn=lambda: 60.0)
+    assert poller.refreshes == 2
+
+
+@pytest.mark.parametrize(
+    ("age_seconds", "expected_classification"),
+    [(45.0, GOOD), (46.0, RISKY), (120.0, RISKY), (121.0, BAD)],
+)
+def test_assess_poll_age_boundaries(age_seconds: float, expected_classification: str) -> None:
     result = _poll_result(
-        predictions=[_prediction(vehicle_id=None, schedule_relationship="CANCELLED")],
-        vehicles=[],
+        predictions=[_PREDICTION_WITH_V1],
+        vehicles=[_VEHICLE_V1],
+        fetched_at=1000.0,
     )
 
-    assessment = assess_poll(result)
+    assessment = assess_poll(result, now_fn=lambda: 1000.0 + age_seconds)
 
-    assert assessment.classification == UNKNOWN
-    assert "No active predictions" in assessment.reason
+    assert assessment.classification == expected_classification
+
+
+def test_assess_poll_reuses_assessment_for_same_result(monkeypatch: pytest.MonkeyPatch) -> None:
+    calls = []
+    real_assess = scorer._assess_predictions
+
+    def counting_assess(result: PollResult) -> ReliabilityAssessment:
+        calls.append(result)
+        return real_assess(result)
+
+    monkeypatch.setattr(scorer, "_assess_predictions", counting_assess)
+    result = _poll_result(
+        predictions=[_PREDICTION_WITH_V1],
+        vehicles=[_VEHICLE_V1],
+    )
+
+    first = assess_poll(result)
+    second = assess_poll(result)
+    assert first.classification == GOOD
+    assert second is first
+    assert calls == [result]
+
+    newer = _poll_result(
+        predictions=[_PREDICTION_WITH_V1],
+        vehicles=[_VEHICLE_V1],
+    )
+    assert assess_poll(newer).classification == GOOD
+    assert len(calls) == 2
+    assert calls[1] is newer
+
+
+def _assess_via_poll(prediction: dict, vehicles_by_id: dict[str, dict]) -> ReliabilityAssessment:
+    return assess_poll(_poll_result(predictions=[prediction], vehicles=list(vehicles_by_id.values())))
+
+
+@pytest.mark.parametrize("assess_fn", [assess_reliability, _assess_via_poll])
+@pytest.mark.parametrize(
+    ("prediction", "vehicles_by_id", "expected_classification", "expected_reason"),
+    [
+        (_PREDICTION_NO_VEHICLE, {}, RISKY, "no assigned vehicle"),
+        (_PREDICTION_WITH_V1, {}, RISKY, "missing from include data"),
+        (_PREDICTION_WITH_V1, {"v1": {"id": "v1", "attributes": {}}}, RISKY, "no update timestamp"),
+        (_PREDICTION_WITH_V1, {"v1": _VEHICLE_V1}, GOOD, "Vehicle assigned"),
+        (_PREDICTION_CANCELLED, {}, UNKNOWN, "No active predictions"),
+        (
+            _PREDICTION_WITH_V1,
+            {"v1": {"id": "v1", "attributes": {"updated_at": "yesterday"}}},
+            RISKY,
+            "timestamp unreadable",
+        ),
+        (_PREDICTION_WITH_V1, {"v1": {"id": "v1", "attributes": None}}, RISKY, "no update timestamp"),
+        ({"attributes": None, "relationships": None}, {}, RISKY, "no assigned vehicle"),
+        ({"relationships": {"vehicle": None}}, {}, RISKY, "no assigned vehicle"),
+    ],
+)
+def test_assess_prediction_scenarios(
+    assess_fn,
+    prediction: dict,
+    vehicles_by_id: dict[str, dict],
+    expected_classification: str,
+    expected_reason: str,
+) -> None:
+    assessment = assess_fn(prediction, vehicles_by_id)
+
+    assert assessment.classification == expected_classification
+    assert expected_reason in assessment.reason
 
 
 def test_estimate_time_to_linden_inbound() -> None:
@@ -126,6 +256,5 @@ def test_score_feasibility_good() -> None:
 
 
 def test_score_trip_unassigned_bad() -> None:
-    prediction = _prediction(vehicle_id=None)
-    assessment = score_trip(prediction, {}, 5)
+    assessment = score_trip(_PREDICTION_NO_VEHICLE, {}, 5)
     assert assessment.classification == BAD